@@ -1,8 +1,7 @@
 from enum import IntEnum
-from typing import Final
 
 
 class CalibrationImageState(IntEnum):
-    IGNORE: Final[int] = 0
-    SELECT: Final[int] = 1
-    DELETE: Final[int] = -1  # stage for deletion
+    IGNORE = 0
+    SELECT = 1
+    DELETE = -1  # stage for deletion
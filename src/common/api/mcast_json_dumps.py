@@ -0,0 +1,21 @@
+import json
+import orjson
+from typing import Any, Callable
+
+
+def mcast_json_dumps(
+    value: Any,
+    *,
+    default: Callable[[Any], Any],
+    **kwargs
+) -> str:
+    """
+    Replacement for json.dumps, for use as json_dumps in the Config of pydantic models
+    that are sent over websockets every frame. orjson is considerably faster than the json module.
+    Values computed with numpy (e.g. numpy.float64) are serialized like their Python equivalents.
+    orjson does not take the keyword arguments of json.dumps (e.g. indent),
+    so if any are given then this falls back to json.dumps.
+    """
+    if kwargs:
+        return json.dumps(value, default=default, **kwargs)
+    return orjson.dumps(value, default=default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
@@ -1,6 +1,15 @@
 from src.common.api.mcast_request import MCastRequest
-from pydantic import BaseModel, Field
+from src.common.api.mcast_json_dumps import mcast_json_dumps
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class MCastRequestSeries(BaseModel):
     series: list[MCastRequest] = Field()
+
+    # Serialized form, filled in on first send. Series must not be modified after they have been sent.
+    _serialized: str | None = PrivateAttr(default=None)
+
+    class Config:
+        json_dumps = mcast_json_dumps
+        json_loads = orjson.loads
@@ -5,3 +5,6 @@ from pydantic import BaseModel
 
 class MCastResponse(BaseModel, MCastParsable, abc.ABC):
     parsable_type: str
+
+    class Config:
+        copy_on_model_validation = "none"
@@ -1,7 +1,14 @@
 from src.common.api.mcast_response import MCastResponse
+from src.common.api.mcast_json_dumps import mcast_json_dumps
+import orjson
 from pydantic import BaseModel, Field
 
 
 class MCastResponseSeries(BaseModel):
     series: list[MCastResponse] = Field(default=list())
+    requests_parsed: bool = Field(default=True)  # False if the request series could not be parsed at all
     responder: str = Field(default=str())
+
+    class Config:
+        json_dumps = mcast_json_dumps
+        json_loads = orjson.loads
@@ -22,7 +22,8 @@ def get_kwarg(
             raise ValueError(f"Missing required key {key} in keyword arguments.")
         return None
     value: T = kwargs[key]
-    if not isinstance(value, arg_type):
+    # Arguments are nearly always of exactly the expected type, which is cheaper to check than isinstance
+    if type(value) is not arg_type and not isinstance(value, arg_type):
         raise ValueError(
             f"Expected keyword argument {key} to be of type {arg_type.__name__}, "
             f"but got {type(value).__name__}.")
@@ -1,9 +1,12 @@
 from .structures import CaptureFormat
-import base64
 import cv2
 import logging
 import numpy
 from typing import Literal
+try:
+    import pybase64 as base64  # SIMD-accelerated, and a drop-in replacement for the standard library module
+except ImportError:
+    import base64
 
 
 logger = logging.getLogger(__file__)
@@ -48,8 +51,11 @@ class ImageCoding:
 
     @staticmethod
     def bytes_to_base64(
-        image_bytes: bytes
+        image_bytes: bytes | numpy.ndarray
     ) -> str:
+        """
+        :param image_bytes: Any bytes-like buffer, e.g. the ndarray output by cv2.imencode (which then is not copied)
+        """
         return base64.b64encode(image_bytes).decode("ascii")
 
     @staticmethod
@@ -17,6 +17,7 @@ import abc
 import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 import logging
+import orjson
 from pydantic import BaseModel, ValidationError
 from typing import Callable, Optional, TypeVar
 
@@ -62,8 +63,11 @@ class MCastComponent(abc.ABC):
     def parse_dynamic_series_list(
         self,
         parsable_series_dict: dict,
-        supported_types: list[type[ParsableDynamicSingle]]
+        supported_types: dict[str, type[ParsableDynamicSingle]]
     ) -> list[ParsableDynamicSingle]:
+        """
+        :param supported_types: Mapping from parsable_type_identifier() to the type it identifies
+        """
         if "series" not in parsable_series_dict or not isinstance(parsable_series_dict["series"], list):
             message: str = "parsable_series_dict did not contain field series. Input is improperly formatted."
             self.add_status_message(
@@ -88,8 +92,11 @@ class MCastComponent(abc.ABC):
     def parse_dynamic_single(
         self,
         parsable_dict: dict,
-        supported_types: list[type[ParsableDynamicSingle]]
+        supported_types: dict[str, type[ParsableDynamicSingle]]
     ) -> ParsableDynamicSingle:
+        """
+        :param supported_types: Mapping from parsable_type_identifier() to the type it identifies
+        """
         if "parsable_type" not in parsable_dict or not isinstance(parsable_dict["parsable_type"], str):
             message: str = "parsable_dict did not contain parsable_type. Input is improperly formatted."
             self.add_status_message(
@@ -97,20 +104,20 @@ class MCastComponent(abc.ABC):
                 message=message)
             raise ParsingError(message) from None
 
-        for supported_type in supported_types:
-            if parsable_dict["parsable_type"] == supported_type.parsable_type_identifier():
-                request: ParsableDynamicSingle
-                try:
-                    request = supported_type(**parsable_dict)
-                except ValidationError as e:
-                    raise ParsingError(f"A request of type {supported_type} was ill-formed: {str(e)}") from None
-                return request
+        supported_type: type[ParsableDynamicSingle] | None = supported_types.get(parsable_dict["parsable_type"])
+        if supported_type is None:
+            message: str = "parsable_type did not match any expected value. Input is improperly formatted."
+            self.add_status_message(
+                severity="error",
+                message=message)
+            raise ParsingError(message)
 
-        message: str = "parsable_type did not match any expected value. Input is improperly formatted."
-        self.add_status_message(
-            severity="error",
-            message=message)
-        raise ParsingError(message)
+        request: ParsableDynamicSingle
+        try:
+            request = supported_type(**parsable_dict)
+        except ValidationError as e:
+            raise ParsingError(f"A request of type {supported_type} was ill-formed: {str(e)}") from None
+        return request
 
     def dequeue_status_messages(self, **kwargs) -> DequeueStatusMessagesResponse:
         """
@@ -142,14 +149,17 @@ class MCastComponent(abc.ABC):
         try:
             client_identifier: str = f"{websocket.client.host}:{websocket.client.port}"
             self.add_status_subscriber(client_identifier=client_identifier)
+            supported_request_types: dict[str, type[MCastRequest]] = {
+                request_type.parsable_type_identifier(): request_type
+                for request_type in self.supported_request_types()}
             request_series: MCastRequestSeries
             response_series: MCastResponseSeries
             while True:
-                request_series_dict = await websocket.receive_json()
+                request_series_dict = orjson.loads(await websocket.receive_text())
                 try:
                     request_series_list: list[MCastRequest] = self.parse_dynamic_series_list(
                         parsable_series_dict=request_series_dict,
-                        supported_types=list(self.supported_request_types().keys()))
+                        supported_types=supported_request_types)
                 except ParsingError as e:
                     logger.exception(str(e))
                     await websocket.send_json(MCastResponseSeries(requests_parsed=False).dict())
@@ -157,7 +167,8 @@ class MCastComponent(abc.ABC):
                 response_series: MCastResponseSeries = self.websocket_handle_requests(
                     client_identifier=client_identifier,
                     request_series=MCastRequestSeries(series=request_series_list))
-                await websocket.send_json(response_series.dict())
+                # All responses to the series, including any dequeued status messages, go out as one message
+                await websocket.send_text(response_series.json())
         except WebSocketDisconnect as e:
             print(f"DISCONNECTED: {str(e)}")
             logger.info(str(e))
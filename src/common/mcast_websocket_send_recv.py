@@ -1,5 +1,5 @@
 from src.common import MCastRequestSeries, MCastResponseSeries
-import json
+import orjson
 from pydantic import BaseModel
 from typing import Callable
 from websockets import WebSocketClientProtocol
@@ -14,18 +14,25 @@ async def mcast_websocket_send_recv(
     """
     Send data via a websocket and get the response (if specified).
     The response can be a subclass of pydantic's BaseModel, a dict, or None, according to response_type.
+    The whole request series is written as a single websocket message, so callers that have several
+    request series for the same component should concatenate them into one series and call this once,
+    rather than once per series.
     """
-    request_series_dict: dict
-    if isinstance(request_series, BaseModel):
-        request_series_dict = request_series.dict()
+    request_series_str: str
+    if isinstance(request_series, MCastRequestSeries):
+        # Shared series (e.g. the every-frame status dequeue) are serialized only once
+        if request_series._serialized is None:
+            request_series._serialized = request_series.json()
+        request_series_str = request_series._serialized
+    elif isinstance(request_series, BaseModel):
+        request_series_str = request_series.json()
     else:
-        request_series_dict = dict(request_series)
-    request_series_str: str = json.dumps(request_series_dict)
+        request_series_str = orjson.dumps(dict(request_series)).decode()
     await websocket.send(request_series_str)
     if response_series_type is None:
         return None
     response_series_str: str = await websocket.recv()
-    response_series_dict: dict = json.loads(response_series_str)
+    response_series_dict: dict = orjson.loads(response_series_str)
     if response_series_type is dict:
         return response_series_dict
     assert isinstance(response_series_type, type)
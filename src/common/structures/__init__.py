@@ -2,6 +2,7 @@ from .capture_format import CaptureFormat
 from .capture_status import CaptureStatus
 from .component_role_label import \
     ComponentRoleLabel, \
+    COMPONENT_ROLE_LABEL_CONNECTOR, \
     COMPONENT_ROLE_LABEL_DETECTOR, \
     COMPONENT_ROLE_LABEL_POSE_SOLVER
 from .corner_refinement import \
@@ -4,3 +4,6 @@ from pydantic import BaseModel, Field
 class MarkerCornerImagePoint(BaseModel):
     x_px: float = Field()
     y_px: float = Field()
+
+    class Config:
+        copy_on_model_validation = "none"
@@ -5,3 +5,6 @@ from pydantic import BaseModel, Field
 class MarkerSnapshot(BaseModel):
     label: str = Field()
     corner_image_points: list[MarkerCornerImagePoint] = Field()
+
+    class Config:
+        copy_on_model_validation = "none"  # Passed from detector responses into pose solver requests as-is
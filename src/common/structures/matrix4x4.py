@@ -21,6 +21,12 @@ class Matrix4x4(BaseModel):
              [a[8],  a[9],  a[10], a[11]],
              [a[12], a[13], a[14], a[15]]])
 
+    def translation(self) -> list[float]:
+        """
+        x, y, z of the last column, taken from the row-major values in one slice
+        """
+        return self.values[3:12:4]
+
     def __getitem__(self, idx: tuple[int, int]) -> float:
         if isinstance(idx, tuple):
             return self.values[(idx[0]*4) + idx[1]]
@@ -31,7 +37,7 @@ class Matrix4x4(BaseModel):
         if not isinstance(other, Matrix4x4):
             raise ValueError
         result_numpy_array = numpy.matmul(self.as_numpy_array(), other.as_numpy_array())
-        return Matrix4x4(values=list(result_numpy_array.flatten()))
+        return Matrix4x4(values=result_numpy_array.flatten().tolist())
 
     @staticmethod
     def from_raw_values(
@@ -63,4 +69,4 @@ class Matrix4x4(BaseModel):
         for i in range(0, len(value_array)):
             if len(value_array[i]) != 4:
                 raise ValueError(f"Expected input row {i} to have 4 col. Got {len(value_array[i])}.")
-        return Matrix4x4(values=list(value_array.flatten()))
+        return Matrix4x4(values=value_array.flatten().tolist())  # Python floats, rather than numpy.float64
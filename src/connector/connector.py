@@ -11,7 +11,9 @@ from src.common import \
     MCastResponseSeries, \
     mcast_websocket_send_recv, \
     StatusMessageSource
+from src.common.exceptions import ParsingError
 from src.common.structures import \
+    COMPONENT_ROLE_LABEL_CONNECTOR, \
     COMPONENT_ROLE_LABEL_DETECTOR, \
     COMPONENT_ROLE_LABEL_POSE_SOLVER, \
     DetectorFrame, \
@@ -54,10 +56,14 @@ from src.pose_solver.api import \
     SetIntrinsicParametersRequest, \
     StartPoseSolverRequest, \
     StopPoseSolverRequest
+import asyncio
 import datetime
 from enum import IntEnum, StrEnum
+import itertools
 import logging
-from typing import Callable, Final, Optional, Tuple
+import time
+from typing import Awaitable, Callable, Final, Optional, Tuple
+from pydantic import ValidationError
 import uuid
 from websockets import \
     connect
@@ -65,7 +71,7 @@ from websockets import \
 logger = logging.getLogger(__name__)
 
 
-SUPPORTED_RESPONSE_TYPES: list[type[MCastResponse]] = [
+SUPPORTED_RESPONSE_TYPES: Final[tuple[type[MCastResponse], ...]] = (
     AddCalibrationImageResponse,
     AddTargetMarkerResponse,
     CalibrateResponse,
@@ -82,7 +88,36 @@ SUPPORTED_RESPONSE_TYPES: list[type[MCastResponse]] = [
     GetPosesResponse,
     ListCalibrationDetectorResolutionsResponse,
     ListCalibrationImageMetadataResponse,
-    ListCalibrationResultMetadataResponse]
+    ListCalibrationResultMetadataResponse)
+SUPPORTED_RESPONSE_TYPES_BY_IDENTIFIER: Final[dict[str, type[MCastResponse]]] = {
+    response_type.parsable_type_identifier(): response_type
+    for response_type in SUPPORTED_RESPONSE_TYPES}
+_DEQUEUE_STATUS_MESSAGES_RESPONSE_TYPE: Final[str] = DequeueStatusMessagesResponse.parsable_type_identifier()
+
+# Detectors may send some larger uncompressed images, which the default max_size might have trouble with.
+# Other components only send small payloads, so a smaller limit gives earlier back-pressure.
+_WEBSOCKET_MAX_SIZE_BYTES_DETECTOR: Final[int] = 2**48
+_WEBSOCKET_MAX_SIZE_BYTES_DEFAULT: Final[int] = 2**20
+
+_NANOSECONDS_PER_SECOND: Final[int] = 1_000_000_000
+
+# Maximum number of connections of each role whose per-frame update may be in progress at once
+_CONCURRENT_UPDATE_COUNT_MAXIMUM_BY_ROLE: Final[dict[str, int]] = {
+    COMPONENT_ROLE_LABEL_CONNECTOR: 4,
+    COMPONENT_ROLE_LABEL_DETECTOR: 8,
+    COMPONENT_ROLE_LABEL_POSE_SOLVER: 4}
+
+# Connections in these states require no work in the per-frame update
+_CONNECTION_STATUSES_IDLE: Final[frozenset[str]] = frozenset({"disconnected", "aborted"})
+
+# Request series that carry no per-call state can be shared rather than re-created on every push.
+# These must not be mutated.
+_DEQUEUE_STATUS_MESSAGES_REQUEST: Final[DequeueStatusMessagesRequest] = DequeueStatusMessagesRequest()
+_DEQUEUE_STATUS_MESSAGES_SERIES: Final[MCastRequestSeries] = \
+    MCastRequestSeries(series=[_DEQUEUE_STATUS_MESSAGES_REQUEST])
+_GET_MARKER_SNAPSHOTS_SERIES: Final[MCastRequestSeries] = MCastRequestSeries(series=[GetMarkerSnapshotsRequest()])
+_STOP_CAPTURE_SERIES: Final[MCastRequestSeries] = MCastRequestSeries(series=[StopCaptureRequest()])
+_STOP_POSE_SOLVER_SERIES: Final[MCastRequestSeries] = MCastRequestSeries(series=[StopPoseSolverRequest()])
 
 
 class Connector(MCastComponent):
@@ -106,6 +141,8 @@ class Connector(MCastComponent):
         SET_INTRINSICS: Final[int] = 5
 
     class Connection:
+        __slots__ = ("static", "dynamic", "uri")
+
         def __init__(
             self,
             static: ComponentConnectionStatic,
@@ -113,11 +150,24 @@ class Connector(MCastComponent):
         ):
             self.static = static
             self.dynamic = dynamic
+            self.uri = f"ws://{static.ip_address}:{static.port}/websocket"
 
         static: ComponentConnectionStatic
         dynamic: ComponentConnectionDynamic
+        uri: str  # derived from static, which does not change over the lifetime of the connection
 
     class LiveDetector:
+        __slots__ = (
+            "request_id",
+            "calibration_result_identifier",
+            "calibrated_resolutions",
+            "current_resolution",
+            "current_intrinsic_parameters",
+            "detected_marker_snapshots",
+            "rejected_marker_snapshots",
+            "marker_snapshot_timestamp",
+            "marker_snapshot_timestamp_utc_iso8601")
+
         request_id: uuid.UUID | None
 
         calibration_result_identifier: str | None
@@ -127,7 +177,8 @@ class Connector(MCastComponent):
 
         detected_marker_snapshots: list[MarkerSnapshot]
         rejected_marker_snapshots: list[MarkerSnapshot]
-        marker_snapshot_timestamp: datetime.datetime
+        marker_snapshot_timestamp: float  # time.monotonic() seconds, for comparing recency
+        marker_snapshot_timestamp_utc_iso8601: str  # wall clock, for reporting
 
         def __init__(self):
             self.request_id = None
@@ -137,21 +188,32 @@ class Connector(MCastComponent):
             self.current_intrinsic_parameters = None
             self.detected_marker_snapshots = list()
             self.rejected_marker_snapshots = list()
-            self.marker_snapshot_timestamp = datetime.datetime.min
+            self.marker_snapshot_timestamp = 0.0
+            self.marker_snapshot_timestamp_utc_iso8601 = datetime.datetime.min.isoformat()
 
     class LivePoseSolver:
+        __slots__ = (
+            "request_id",
+            "detector_poses",
+            "target_poses",
+            "detector_timestamps",
+            "poses_timestamp",
+            "poses_timestamp_utc_iso8601")
+
         request_id: uuid.UUID | None
         detector_poses: list[Pose]
         target_poses: list[Pose]
-        detector_timestamps: dict[str, datetime.datetime]  # access by detector_label
-        poses_timestamp: datetime.datetime
+        detector_timestamps: dict[str, float]  # access by detector_label, time.monotonic() seconds
+        poses_timestamp: float  # time.monotonic() seconds, for comparing recency
+        poses_timestamp_utc_iso8601: str  # wall clock, for reporting
 
         def __init__(self):
             self.request_id = None
             self.detector_poses = list()
             self.target_poses = list()
             self.detector_timestamps = dict()
-            self.poses_timestamp = datetime.datetime.min
+            self.poses_timestamp = 0.0
+            self.poses_timestamp_utc_iso8601 = datetime.datetime.min.isoformat()
 
     _serial_identifier: str
 
@@ -161,7 +223,7 @@ class Connector(MCastComponent):
     _startup_state: StartupState
 
     _connections: dict[str, Connection]
-    _pending_request_ids: list[uuid.UUID]
+    _pending_request_ids: set[uuid.UUID]
     _live_detectors: dict[str, LiveDetector]  # access by detector_label
     _live_pose_solvers: dict[str, LivePoseSolver]  # access by pose_solver_label
 
@@ -169,6 +231,13 @@ class Connector(MCastComponent):
 
     # None indicates that no response has been received yet.
     _response_series_by_id: dict[uuid.UUID, MCastResponseSeries | None]
+    # Request series IDs only need to be unique within this connector, so they are numbered
+    # rather than drawn from os.urandom() for every request series as uuid4() would.
+    _request_series_id_counter: itertools.count
+
+    _update_semaphores_by_role: dict[str, asyncio.Semaphore]
+    _response_group_handlers_by_type: dict[type[MCastResponse], Callable[[list, str], bool]]
+    _update_frame_handlers_by_status: dict[str, Callable[[Connection], Awaitable[None]]]
 
     def __init__(
         self,
@@ -189,12 +258,22 @@ class Connector(MCastComponent):
         self._startup_state = Connector.StartupState.INITIAL
 
         self._connections = dict()
-        self._pending_request_ids = list()
+        self._pending_request_ids = set()
         self._live_detectors = dict()
         self._live_pose_solvers = dict()
 
         self._request_series_by_label = dict()
         self._response_series_by_id = dict()
+        self._request_series_id_counter = itertools.count(start=1)
+
+        self._update_semaphores_by_role = {
+            role: asyncio.Semaphore(concurrent_update_count)
+            for role, concurrent_update_count in _CONCURRENT_UPDATE_COUNT_MAXIMUM_BY_ROLE.items()}
+        self._update_frame_handlers_by_status = {
+            "disconnecting": self._update_frame_for_disconnecting_connection,
+            "connecting": self._update_frame_for_connecting_connection,
+            "connected": self._update_frame_for_connected_connection}
+        self._response_group_handlers_by_type = self._build_response_group_handlers()
 
     def add_connection(
         self,
@@ -209,25 +288,29 @@ class Connector(MCastComponent):
             dynamic=connection_dynamic)
 
     def begin_connecting(self, label: str) -> None:
-        if label not in self._connections:
+        connection: Connector.Connection | None = self._connections.get(label)
+        if connection is None:
             message: str = f"label {label} is not in list. Returning."
             self.add_status_message(severity="error", message=message)
             return
-        if self._connections[label].dynamic.status == "connected":
+        dynamic: ComponentConnectionDynamic = connection.dynamic
+        if dynamic.status == "connected":
             message: str = f"label {label} is already connected. Returning."
             self.add_status_message(severity="warning", message=message)
             return
-        self._connections[label].dynamic.status = "connecting"
-        self._connections[label].dynamic.attempt_count = 0
+        dynamic.status = "connecting"
+        dynamic.attempt_count = 0
 
     def begin_disconnecting(self, label: str) -> None:
-        if label not in self._connections:
+        connection: Connector.Connection | None = self._connections.get(label)
+        if connection is None:
             message: str = f"label {label} is not in list. Returning."
             self.add_status_message(severity="error", message=message)
             return
-        self._connections[label].dynamic.status = "disconnecting"
-        self._connections[label].dynamic.attempt_count = 0
-        self._connections[label].dynamic.socket = None
+        dynamic: ComponentConnectionDynamic = connection.dynamic
+        dynamic.status = "disconnecting"
+        dynamic.attempt_count = 0
+        dynamic.socket = None
 
     def contains_connection_label(self, label: str) -> bool:
         return label in self._connections
@@ -279,7 +362,7 @@ class Connector(MCastComponent):
         return DetectorFrame(
             detected_marker_snapshots=self._live_detectors[detector_label].detected_marker_snapshots,
             rejected_marker_snapshots=self._live_detectors[detector_label].rejected_marker_snapshots,
-            timestamp_utc_iso8601=self._live_detectors[detector_label].marker_snapshot_timestamp.isoformat())
+            timestamp_utc_iso8601=self._live_detectors[detector_label].marker_snapshot_timestamp_utc_iso8601)
 
     def get_live_pose_solver_frame(
         self,
@@ -293,7 +376,7 @@ class Connector(MCastComponent):
         return PoseSolverFrame(
             detector_poses=self._live_pose_solvers[pose_solver_label].detector_poses,
             target_poses=self._live_pose_solvers[pose_solver_label].target_poses,
-            timestamp_utc_iso8601=self._live_pose_solvers[pose_solver_label].poses_timestamp.isoformat())
+            timestamp_utc_iso8601=self._live_pose_solvers[pose_solver_label].poses_timestamp_utc_iso8601)
 
     def get_status(self):
         return self._status
@@ -328,22 +411,24 @@ class Connector(MCastComponent):
         response: GetMarkerSnapshotsResponse,
         detector_label: str
     ):
-        if detector_label in self._live_detectors.keys():
+        if detector_label in self._live_detectors:
             self._live_detectors[detector_label].detected_marker_snapshots = response.detected_marker_snapshots
             self._live_detectors[detector_label].rejected_marker_snapshots = response.rejected_marker_snapshots
-            self._live_detectors[detector_label].marker_snapshot_timestamp = \
-                datetime.datetime.utcnow()  # TODO: This should come from the detector
+            self._live_detectors[detector_label].marker_snapshot_timestamp = time.monotonic()
+            self._live_detectors[detector_label].marker_snapshot_timestamp_utc_iso8601 = \
+                datetime.datetime.utcnow().isoformat()  # TODO: This should come from the detector
 
     def handle_response_get_poses(
         self,
         response: GetPosesResponse,
         pose_solver_label: str
     ) -> None:
-        if pose_solver_label in self._live_pose_solvers.keys():
+        if pose_solver_label in self._live_pose_solvers:
             self._live_pose_solvers[pose_solver_label].detector_poses = response.detector_poses
             self._live_pose_solvers[pose_solver_label].target_poses = response.target_poses
-            self._live_pose_solvers[pose_solver_label].poses_timestamp = \
-                datetime.datetime.utcnow()  # TODO: This should come from the pose solver
+            self._live_pose_solvers[pose_solver_label].poses_timestamp = time.monotonic()
+            self._live_pose_solvers[pose_solver_label].poses_timestamp_utc_iso8601 = \
+                datetime.datetime.utcnow().isoformat()  # TODO: This should come from the pose solver
 
     def handle_response_list_calibration_detector_resolutions(
         self,
@@ -370,6 +455,123 @@ class Connector(MCastComponent):
                 newest_result_id = result_metadata.identifier
         self._live_detectors[detector_label].calibration_result_identifier = newest_result_id
 
+    @staticmethod
+    def _group_responses_by_type(
+        responses: list[MCastResponse]
+    ) -> dict[type[MCastResponse], list[MCastResponse]]:
+        """
+        Group responses by their concrete type, preserving the order of first appearance of each type
+        as well as the relative order of responses within each group.
+        """
+        responses_by_type: dict[type[MCastResponse], list[MCastResponse]] = dict()
+        for response in responses:
+            response_type: type[MCastResponse] = type(response)
+            if response_type in responses_by_type:
+                responses_by_type[response_type].append(response)
+            else:
+                responses_by_type[response_type] = [response]
+        return responses_by_type
+
+    # Response groups are handled by the concrete type of their responses, all responses in a group being
+    # of the same type. Each handler returns False if errors occurred.
+    # For response types whose handling overwrites prior state, only the most recent one needs to be handled.
+    def _build_response_group_handlers(self) -> dict[type[MCastResponse], Callable[[list, str], bool]]:
+        return {
+            AddTargetMarkerResponse: self._handle_response_group_ignored,
+            EmptyResponse: self._handle_response_group_ignored,
+            ErrorResponse: self._handle_response_group_error,
+            GetCalibrationResultResponse: self._handle_response_group_get_calibration_result,
+            GetCapturePropertiesResponse: self._handle_response_group_get_capture_properties,
+            GetMarkerSnapshotsResponse: self._handle_response_group_get_marker_snapshots,
+            GetPosesResponse: self._handle_response_group_get_poses,
+            ListCalibrationDetectorResolutionsResponse:
+                self._handle_response_group_list_calibration_detector_resolutions,
+            ListCalibrationResultMetadataResponse: self._handle_response_group_list_calibration_result_metadata}
+
+    def _handle_response_group_unknown(
+        self,
+        responses: list[MCastResponse],
+        _responder: str
+    ) -> bool:
+        for response in responses:
+            self.handle_response_unknown(response=response)
+        return False
+
+    @staticmethod
+    def _handle_response_group_ignored(
+        _responses: list[MCastResponse],
+        _responder: str
+    ) -> bool:
+        return True  # we don't currently do anything with these responses in this interface
+
+    def _handle_response_group_error(
+        self,
+        responses: list[ErrorResponse],
+        _responder: str
+    ) -> bool:
+        for response in responses:
+            self.handle_error_response(response=response)
+        return False
+
+    def _handle_response_group_get_calibration_result(
+        self,
+        responses: list[GetCalibrationResultResponse],
+        _responder: str
+    ) -> bool:
+        for response in responses:
+            self.handle_response_get_calibration_result(response=response)
+        return True
+
+    def _handle_response_group_get_capture_properties(
+        self,
+        responses: list[GetCapturePropertiesResponse],
+        responder: str
+    ) -> bool:
+        self.handle_response_get_capture_properties(
+            response=responses[-1],
+            detector_label=responder)
+        return True
+
+    def _handle_response_group_get_marker_snapshots(
+        self,
+        responses: list[GetMarkerSnapshotsResponse],
+        responder: str
+    ) -> bool:
+        self.handle_response_get_marker_snapshots(
+            response=responses[-1],
+            detector_label=responder)
+        return True
+
+    def _handle_response_group_get_poses(
+        self,
+        responses: list[GetPosesResponse],
+        responder: str
+    ) -> bool:
+        self.handle_response_get_poses(
+            response=responses[-1],
+            pose_solver_label=responder)
+        return True
+
+    def _handle_response_group_list_calibration_detector_resolutions(
+        self,
+        responses: list[ListCalibrationDetectorResolutionsResponse],
+        responder: str
+    ) -> bool:
+        self.handle_response_list_calibration_detector_resolutions(
+            response=responses[-1],
+            detector_label=responder)
+        return True
+
+    def _handle_response_group_list_calibration_result_metadata(
+        self,
+        responses: list[ListCalibrationResultMetadataResponse],
+        responder: str
+    ) -> bool:
+        self.handle_response_list_calibration_result_metadata(
+            response=responses[-1],
+            detector_label=responder)
+        return True
+
     def handle_response_unknown(
         self,
         response: MCastResponse
@@ -402,43 +604,14 @@ class Connector(MCastComponent):
                             f"but it contained more responses ({response_count}) "
                             f"than expected ({expected_response_count}).")
 
+        # Responses are grouped by concrete type so that each type is dispatched once per series.
+        responses_by_type: dict[type[MCastResponse], list[MCastResponse]] = \
+            self._group_responses_by_type(responses=response_series.series)
         success: bool = True
-        response: MCastResponse
-        for response in response_series.series:
-            if isinstance(response, AddTargetMarkerResponse):
-                success = True  # we don't currently do anything with this response in this interface
-            elif isinstance(response, GetCalibrationResultResponse):
-                self.handle_response_get_calibration_result(response=response)
-                success = True
-            elif isinstance(response, GetCapturePropertiesResponse):
-                self.handle_response_get_capture_properties(
-                    response=response,
-                    detector_label=response_series.responder)
-                success = True
-            elif isinstance(response, GetMarkerSnapshotsResponse):
-                self.handle_response_get_marker_snapshots(
-                    response=response,
-                    detector_label=response_series.responder)
-            elif isinstance(response, GetPosesResponse):
-                self.handle_response_get_poses(
-                    response=response,
-                    pose_solver_label=response_series.responder)
-                success = True
-            elif isinstance(response, ListCalibrationDetectorResolutionsResponse):
-                self.handle_response_list_calibration_detector_resolutions(
-                    response=response,
-                    detector_label=response_series.responder)
-                success = True
-            elif isinstance(response, ListCalibrationResultMetadataResponse):
-                self.handle_response_list_calibration_result_metadata(
-                    response=response,
-                    detector_label=response_series.responder)
-                success = True
-            elif isinstance(response, ErrorResponse):
-                self.handle_error_response(response=response)
-                success = False
-            elif not isinstance(response, EmptyResponse):
-                self.handle_response_unknown(response=response)
+        for response_type, responses in responses_by_type.items():
+            response_group_handler: Callable[[list, str], bool] = self._response_group_handlers_by_type.get(
+                response_type, self._handle_response_group_unknown)
+            if not response_group_handler(responses, response_series.responder):
                 success = False
         return success
 
@@ -454,8 +627,7 @@ class Connector(MCastComponent):
                 if stored_request_id == request_id:
                     self._request_series_by_label[client_identifier].pop(stored_request_index)
                     break
-        if request_id in self._response_series_by_id:
-            del self._response_series_by_id[request_id]
+        self._response_series_by_id.pop(request_id, None)
 
     def is_running(self):
         return self._status == Connector.Status.RUNNING
@@ -475,7 +647,7 @@ class Connector(MCastComponent):
                         series=[
                             ListCalibrationDetectorResolutionsRequest(),
                             GetCapturePropertiesRequest()])
-                    self._pending_request_ids.append(self.request_series_push(
+                    self._pending_request_ids.add(self.request_series_push(
                         connection_label=detector_label,
                         request_series=request_series))
                 self._startup_state = Connector.StartupState.GET_RESOLUTIONS
@@ -503,7 +675,7 @@ class Connector(MCastComponent):
                                     f"at resolution {str(live_detector.current_resolution)}. "
                                     "No intrinsics will be set.")
                     request_series: MCastRequestSeries = MCastRequestSeries(series=requests)
-                    self._pending_request_ids.append(self.request_series_push(
+                    self._pending_request_ids.add(self.request_series_push(
                         connection_label=detector_label,
                         request_series=request_series))
                 self._startup_state = Connector.StartupState.LIST_INTRINSICS
@@ -516,7 +688,7 @@ class Connector(MCastComponent):
                         series=[
                             GetCalibrationResultRequest(
                                 result_identifier=live_detector.calibration_result_identifier)])
-                    self._pending_request_ids.append(self.request_series_push(
+                    self._pending_request_ids.add(self.request_series_push(
                         connection_label=detector_label,
                         request_series=request_series))
                 self._startup_state = Connector.StartupState.GET_INTRINSICS
@@ -537,7 +709,7 @@ class Connector(MCastComponent):
                                 intrinsic_parameters=live_detector.current_intrinsic_parameters))
                         requests.append(StartPoseSolverRequest())
                         request_series: MCastRequestSeries = MCastRequestSeries(series=requests)
-                        self._pending_request_ids.append(self.request_series_push(
+                        self._pending_request_ids.add(self.request_series_push(
                             connection_label=pose_solver_label,
                             request_series=request_series))
                     self._startup_state = Connector.StartupState.SET_INTRINSICS
@@ -571,7 +743,7 @@ class Connector(MCastComponent):
                 series=[
                     StartCaptureRequest(),
                     ListCalibrationDetectorResolutionsRequest()])
-            self._pending_request_ids.append(self.request_series_push(
+            self._pending_request_ids.add(self.request_series_push(
                 connection_label=detector_label,
                 request_series=request_series))
         self._startup_state = Connector.StartupState.STARTING_CAPTURE
@@ -581,23 +753,20 @@ class Connector(MCastComponent):
         # TODO: Just ignore these existing requests, no need to wait for them or react to responses
         for live_detector in self._live_detectors.values():
             if live_detector.request_id is not None:
-                self._pending_request_ids.append(live_detector.request_id)
+                self._pending_request_ids.add(live_detector.request_id)
         for live_pose_solver in self._live_pose_solvers.values():
             if live_pose_solver.request_id is not None:
-                self._pending_request_ids.append(live_pose_solver.request_id)
+                self._pending_request_ids.add(live_pose_solver.request_id)
 
-        for detector_label in self._live_detectors.keys():
-            request_series: MCastRequestSeries = MCastRequestSeries(
-                series=[StopCaptureRequest()])
-            self._pending_request_ids.append(self.request_series_push(
+        for detector_label in self._live_detectors:
+            self._pending_request_ids.add(self.request_series_push(
                 connection_label=detector_label,
-                request_series=request_series))
+                request_series=_STOP_CAPTURE_SERIES))
 
-        for pose_solver_label in self._live_pose_solvers.keys():
-            request_series: MCastRequestSeries = MCastRequestSeries(series=[StopPoseSolverRequest()])
-            self._pending_request_ids.append(self.request_series_push(
+        for pose_solver_label in self._live_pose_solvers:
+            self._pending_request_ids.add(self.request_series_push(
                 connection_label=pose_solver_label,
-                request_series=request_series))
+                request_series=_STOP_POSE_SOLVER_SERIES))
 
         self._live_detectors.clear()
         self._live_pose_solvers.clear()
@@ -607,9 +776,10 @@ class Connector(MCastComponent):
         self,
         label: str
     ):
-        if label not in self._connections:
-            raise RuntimeError(f"Failed to find connection associated with {label}.")
-        self._connections.pop(label)
+        try:
+            self._connections.pop(label)
+        except KeyError:
+            raise RuntimeError(f"Failed to find connection associated with {label}.") from None
 
     def request_series_push(
         self,
@@ -618,7 +788,7 @@ class Connector(MCastComponent):
     ) -> uuid.UUID:
         if connection_label not in self._request_series_by_label:
             self._request_series_by_label[connection_label] = list()
-        request_series_id: uuid.UUID = uuid.uuid4()
+        request_series_id: uuid.UUID = uuid.UUID(int=next(self._request_series_id_counter))
         self._request_series_by_label[connection_label].append((request_series, request_series_id))
         self._response_series_by_id[request_series_id] = None
         return request_series_id
@@ -631,14 +801,15 @@ class Connector(MCastComponent):
         Only "pop" if there is a response (not None).
         Return value is the response series itself (or None)
         """
-        if request_series_id not in self._response_series_by_id:
-            raise ResponseSeriesNotExpected()
+        try:
+            response_series: MCastResponseSeries | None = self._response_series_by_id[request_series_id]
+        except KeyError:
+            raise ResponseSeriesNotExpected() from None
 
-        if self._response_series_by_id[request_series_id] is None:
+        if response_series is None:
             return None
 
-        response_series: MCastResponseSeries = self._response_series_by_id[request_series_id]
-        self._response_series_by_id.pop(request_series_id)
+        del self._response_series_by_id[request_series_id]
         return response_series
 
     def supported_request_types(self) -> dict[type[MCastRequest], Callable[[dict], MCastResponse]]:
@@ -653,7 +824,7 @@ class Connector(MCastComponent):
                 if live_detector.request_id is None:
                     live_detector.request_id = self.request_series_push(
                         connection_label=detector_label,
-                        request_series=MCastRequestSeries(series=[GetMarkerSnapshotsRequest()]))
+                        request_series=_GET_MARKER_SNAPSHOTS_SERIES)
             for pose_solver_label, live_pose_solver in self._live_pose_solvers.items():
                 if live_pose_solver.request_id is not None:
                     _, live_pose_solver.request_id = self.update_request(request_id=live_pose_solver.request_id)
@@ -661,23 +832,23 @@ class Connector(MCastComponent):
                     solver_request_list: list[MCastRequest] = list()
                     detector_labels: list[str] = self.get_connected_detector_labels()
                     for detector_label in detector_labels:
-                        current_detector_frame: DetectorFrame = self.get_live_detector_frame(
-                            detector_label=detector_label)
-                        current_detector_frame_timestamp: datetime.datetime = current_detector_frame.timestamp_utc()
+                        live_detector: Connector.LiveDetector | None = self._live_detectors.get(detector_label)
+                        if live_detector is None:
+                            continue  # Detector was connected after tracking started
+                        current_timestamp: float = live_detector.marker_snapshot_timestamp
                         current_is_new: bool = False
                         if detector_label in live_pose_solver.detector_timestamps:
-                            old_detector_frame_timestamp = live_pose_solver.detector_timestamps[detector_label]
-                            if current_detector_frame_timestamp > old_detector_frame_timestamp:
+                            if current_timestamp > live_pose_solver.detector_timestamps[detector_label]:
                                 current_is_new = True
                         else:
                             current_is_new = True
                         if current_is_new:
-                            live_pose_solver.detector_timestamps[detector_label] = current_detector_frame_timestamp
+                            live_pose_solver.detector_timestamps[detector_label] = current_timestamp
                             marker_request: AddMarkerCornersRequest = AddMarkerCornersRequest(
-                                detected_marker_snapshots=current_detector_frame.detected_marker_snapshots,
-                                rejected_marker_snapshots=current_detector_frame.rejected_marker_snapshots,
+                                detected_marker_snapshots=live_detector.detected_marker_snapshots,
+                                rejected_marker_snapshots=live_detector.rejected_marker_snapshots,
                                 detector_label=detector_label,
-                                detector_timestamp_utc_iso8601=current_detector_frame.timestamp_utc_iso8601)
+                                detector_timestamp_utc_iso8601=live_detector.marker_snapshot_timestamp_utc_iso8601)
                             solver_request_list.append(marker_request)
                     solver_request_list.append(GetPosesRequest())
                     request_series: MCastRequestSeries = MCastRequestSeries(series=solver_request_list)
@@ -686,13 +857,10 @@ class Connector(MCastComponent):
                         request_series=request_series)
 
         if len(self._pending_request_ids) > 0:
-            completed_request_ids: list[uuid.UUID] = list()
-            for request_id in self._pending_request_ids:
-                _, remaining_request_id = self.update_request(request_id=request_id)
-                if remaining_request_id is None:
-                    completed_request_ids.append(request_id)
-            for request_id in completed_request_ids:
-                self._pending_request_ids.remove(request_id)
+            completed_request_ids: set[uuid.UUID] = {
+                request_id for request_id in self._pending_request_ids
+                if self.update_request(request_id=request_id)[1] is None}
+            self._pending_request_ids -= completed_request_ids
             if len(self._pending_request_ids) == 0:
                 self.on_active_request_ids_processed()
 
@@ -723,104 +891,269 @@ class Connector(MCastComponent):
         self,
         connection: Connection
     ) -> None:
-        if connection.dynamic.status == "disconnected" or connection.dynamic.status == "aborted":
-            return
+        # Idle statuses have no handler. A connection that becomes connected is serviced from the next frame.
+        handler: Callable[[Connector.Connection], Awaitable[None]] | None = \
+            self._update_frame_handlers_by_status.get(connection.dynamic.status)
+        if handler is not None:
+            await handler(connection)
 
-        if connection.dynamic.status == "disconnecting":
-            if connection.dynamic.socket is not None:
-                await connection.dynamic.socket.close()
-                connection.dynamic.socket = None
-            connection.dynamic.socket = None
-            connection.dynamic.status = "disconnected"
-
-        if connection.dynamic.status == "connecting":
-            now_utc = datetime.datetime.utcnow()
-            if now_utc >= connection.dynamic.next_attempt_timestamp_utc:
-                connection.dynamic.attempt_count += 1
-                uri: str = f"ws://{connection.static.ip_address}:{connection.static.port}/websocket"
-                try:
-                    connection.dynamic.socket = await connect(
-                        uri=uri,
-                        ping_timeout=None,
-                        open_timeout=None,
-                        close_timeout=None,
-                        max_size=2**48)  # Default max_size might have trouble with some larger uncompressed images
-                except ConnectionError as e:
-                    if connection.dynamic.attempt_count >= ComponentConnectionDynamic.ATTEMPT_COUNT_MAXIMUM:
-                        message = \
-                            f"Failed to connect to {uri} with error: {str(e)}. "\
-                            f"Connection is being aborted after {connection.dynamic.attempt_count} attempts."
-                        self.add_status_message(severity="error", message=message)
-                        connection.dynamic.status = "aborted"
-                    else:
-                        message: str = \
-                            f"Failed to connect to {uri} with error: {str(e)}. "\
-                            f"Will retry in {ComponentConnectionDynamic.ATTEMPT_TIME_GAP_SECONDS} seconds."
-                        self.add_status_message(severity="warning", message=message)
-                        connection.dynamic.next_attempt_timestamp_utc = now_utc + datetime.timedelta(
-                            seconds=ComponentConnectionDynamic.ATTEMPT_TIME_GAP_SECONDS)
-                    return
-                message = f"Connected to {uri}."
-                self.add_status_message(severity="info", message=message)
-                connection.dynamic.status = "connected"
-                connection.dynamic.attempt_count = 0
-
-        if connection.dynamic.status == "connected":
-
-            # TODO: Is this correct or even useful...?
-            # if connection.dynamic.socket.closed:
-            #     message = \
-            #         f"Socket associated with {connection.static.label} appears to have been closed. "\
-            #         f"Will attempt to reconnect."
-            #     self.add_status_message(severity="warning", message=message)
-            #     connection.dynamic.socket = None
-            #     connection.dynamic.status = "connecting"
-            #     connection.dynamic.attempt_count = 0
-            #     return
-
-            def response_series_converter(
-                response_series_dict: dict
-            ) -> MCastResponseSeries:
-                series_list: list[MCastResponse] = self.parse_dynamic_series_list(
-                    parsable_series_dict=response_series_dict,
-                    supported_types=SUPPORTED_RESPONSE_TYPES)
-                return MCastResponseSeries(series=series_list)
-
-            # Handle manually-defined irregular tasks
-            if connection.static.label in self._request_series_by_label:
-                pairs: list[Tuple[MCastRequestSeries, uuid.UUID]] = \
-                    self._request_series_by_label[connection.static.label]
-                for pair in pairs:
-                    response_series: MCastResponseSeries = \
-                        await mcast_websocket_send_recv(
-                            websocket=connection.dynamic.socket,
-                            request_series=pair[0],
-                            response_series_type=MCastResponseSeries,
-                            response_series_converter=response_series_converter)
-                    # TODO: This next line's logic may belong in the response_series_converter
-                    response_series.responder = connection.static.label
-                    self._response_series_by_id[pair[1]] = response_series
-                self._request_series_by_label.pop(connection.static.label)
-
-            # Regular every-frame stuff
-            request_series: list[MCastRequest] = list()
-            request_series.append(DequeueStatusMessagesRequest())
+    async def _update_frame_for_disconnecting_connection(
+        self,
+        connection: Connection
+    ) -> None:
+        if connection.dynamic.socket is not None:
+            await connection.dynamic.socket.close()
+        connection.dynamic.socket = None
+        connection.dynamic.status = "disconnected"
 
+    async def _update_frame_for_connecting_connection(
+        self,
+        connection: Connection
+    ) -> None:
+        now_ns: int = time.monotonic_ns()
+        if now_ns >= connection.dynamic.next_attempt_deadline_ns:
+            connection.dynamic.attempt_count += 1
+            uri: str = connection.uri
+            max_size: int = _WEBSOCKET_MAX_SIZE_BYTES_DEFAULT
+            if connection.static.role == COMPONENT_ROLE_LABEL_DETECTOR:
+                max_size = _WEBSOCKET_MAX_SIZE_BYTES_DETECTOR
+            try:
+                connection.dynamic.socket = await connect(
+                    uri=uri,
+                    ping_timeout=None,
+                    open_timeout=None,
+                    close_timeout=None,
+                    max_size=max_size,
+                    max_queue=None,
+                    compression=None)  # Components are expected to be on a LAN, deflate only costs CPU
+            except ConnectionError as e:
+                if connection.dynamic.attempt_count >= ComponentConnectionDynamic.ATTEMPT_COUNT_MAXIMUM:
+                    message = \
+                        f"Failed to connect to {uri} with error: {str(e)}. "\
+                        f"Connection is being aborted after {connection.dynamic.attempt_count} attempts."
+                    self.add_status_message(severity="error", message=message)
+                    connection.dynamic.status = "aborted"
+                else:
+                    attempt_time_gap_seconds: float = connection.dynamic.next_attempt_time_gap_seconds()
+                    message: str = \
+                        f"Failed to connect to {uri} with error: {str(e)}. "\
+                        f"Will retry in {attempt_time_gap_seconds} seconds."
+                    self.add_status_message(severity="warning", message=message)
+                    connection.dynamic.next_attempt_deadline_ns = \
+                        now_ns + int(attempt_time_gap_seconds * _NANOSECONDS_PER_SECOND)
+                return
+            message = f"Connected to {uri}."
+            self.add_status_message(severity="info", message=message)
+            connection.dynamic.status = "connected"
+            connection.dynamic.attempt_count = 0
+
+    async def _update_frame_for_connected_connection(
+        self,
+        connection: Connection
+    ) -> None:
+        # TODO: Is this correct or even useful...?
+        # if connection.dynamic.socket.closed:
+        #     message = \
+        #         f"Socket associated with {connection.static.label} appears to have been closed. "\
+        #         f"Will attempt to reconnect."
+        #     self.add_status_message(severity="warning", message=message)
+        #     connection.dynamic.socket = None
+        #     connection.dynamic.status = "connecting"
+        #     connection.dynamic.attempt_count = 0
+        #     return
+
+        def response_series_converter(
+            response_series_dict: dict
+        ) -> MCastResponseSeries:
+            series_list: list[MCastResponse] = self.parse_dynamic_series_list(
+                parsable_series_dict=response_series_dict,
+                supported_types=SUPPORTED_RESPONSE_TYPES_BY_IDENTIFIER)
+            return MCastResponseSeries(
+                series=series_list,
+                requests_parsed=response_series_dict.get("requests_parsed", True))
+
+        def dequeue_only_response_series_converter(
+            response_series_dict: dict
+        ) -> MCastResponseSeries:
+            # Most frames only dequeue status messages, so the shape of the reply is known in advance
+            # and the generic per-entry type lookup can be skipped. Anything unexpected falls back to it.
+            response_dicts = response_series_dict.get("series")
+            if isinstance(response_dicts, list) and len(response_dicts) == 1 and \
+               isinstance(response_dicts[0], dict) and \
+               response_dicts[0].get("parsable_type") == _DEQUEUE_STATUS_MESSAGES_RESPONSE_TYPE:
+                try:
+                    return MCastResponseSeries.construct(
+                        series=[DequeueStatusMessagesResponse(**response_dicts[0])])
+                except (KeyError, TypeError, ValidationError) as e:
+                    raise ParsingError(
+                        f"A response of type {_DEQUEUE_STATUS_MESSAGES_RESPONSE_TYPE} was ill-formed: {str(e)}") \
+                        from None
+            return response_series_converter(response_series_dict)
+
+        # All manually-defined irregular tasks and the regular every-frame requests are sent together
+        # as a single request series, so that there is only one round-trip per connection per frame.
+        # The pending list is detached up-front, so that anything pushed while awaiting goes to a fresh list.
+        label: str = connection.static.label
+        pairs: list[Tuple[MCastRequestSeries, uuid.UUID]] = self._request_series_by_label.pop(label, list())
+        requests: list[MCastRequest] = list()
+        request_boundaries: list[int] = list()  # end index (exclusive) of each pair's requests in the batch
+        for pair in pairs:
+            requests.extend(pair[0].series)
+            request_boundaries.append(len(requests))
+
+        # Regular every-frame stuff
+        requests.append(_DEQUEUE_STATUS_MESSAGES_REQUEST)
+        request_series: MCastRequestSeries
+        selected_response_series_converter: Callable[[dict], MCastResponseSeries]
+        if pairs:
+            request_series = MCastRequestSeries(series=requests)
+            selected_response_series_converter = response_series_converter
+        else:
+            request_series = _DEQUEUE_STATUS_MESSAGES_SERIES  # Most frames have nothing else to send
+            selected_response_series_converter = dequeue_only_response_series_converter
+
+        try:
             response_series: MCastResponseSeries = await mcast_websocket_send_recv(
                 websocket=connection.dynamic.socket,
-                request_series=MCastRequestSeries(series=request_series),
+                request_series=request_series,
                 response_series_type=MCastResponseSeries,
-                response_series_converter=response_series_converter)
-            for response in response_series.series:
-                if isinstance(response, DequeueStatusMessagesResponse):
-                    for status_message in response.status_messages:
-                        status_message_dict = status_message.dict()
-                        status_message_dict["source_label"] = connection.static.label
-                        self.add_status_message(**status_message_dict)
+                response_series_converter=selected_response_series_converter)
+        except BaseException:
+            # Requeue the irregular tasks, ahead of anything pushed in the meantime
+            if label not in self._request_series_by_label:
+                self._request_series_by_label[label] = list()
+            self._request_series_by_label[label][0:0] = pairs
+            raise
+
+        # Each request yields exactly one response, so the batch can be split back up by position.
+        responses: list[MCastResponse] = response_series.series
+        if not response_series.requests_parsed:
+            # Nothing in the batch was executed, so each series is resent on its own.
+            # That way a request that cannot be parsed only fails its own series, as when series were sent one by one.
+            # The status messages were not dequeued either, so they are picked up on the next frame.
+            if pairs:
+                await self._send_request_series_individually(
+                    connection=connection,
+                    pairs=pairs,
+                    response_series_converter=response_series_converter)
+            else:
+                self.add_status_message(
+                    severity="error",
+                    message=f"{label} could not parse the status message request sent to it.")
+            return
+        if len(responses) != len(requests):
+            # The requests have been executed, so resending them could e.g. add the same calibration image twice.
+            # Since the responses cannot be attributed, each series gets an error instead.
+            message: str = f"Sent {len(requests)} requests to {label} but received {len(responses)} responses."
+            self.add_status_message(
+                severity="error",
+                message=message)
+            error_response_series: MCastResponseSeries = MCastResponseSeries(
+                series=[ErrorResponse(message=message)],
+                responder=label)
+            for pair in pairs:
+                self._response_series_set_result(
+                    request_series_id=pair[1],
+                    response_series=error_response_series)
+            self._add_dequeued_status_messages(label=label, responses=responses)  # Recognizable by type
+            return
+        response_start_index: int = 0
+        for pair, response_end_index in zip(pairs, request_boundaries):
+            self._response_series_set_result(
+                request_series_id=pair[1],
+                response_series=MCastResponseSeries(
+                    series=responses[response_start_index:response_end_index],
+                    responder=label))
+            response_start_index = response_end_index
+        self._add_dequeued_status_messages(label=label, responses=responses[response_start_index:])
+
+    def _add_dequeued_status_messages(
+        self,
+        label: str,
+        responses: list[MCastResponse]
+    ) -> None:
+        for response in responses:
+            if isinstance(response, DequeueStatusMessagesResponse):
+                for status_message in response.status_messages:
+                    self.add_status_message(
+                        severity=status_message.severity,
+                        message=status_message.message,
+                        source_label=label,
+                        timestamp_utc_iso8601=status_message.timestamp_utc_iso8601)
+
+    def _response_series_set_result(
+        self,
+        request_series_id: uuid.UUID,
+        response_series: MCastResponseSeries
+    ) -> None:
+        # Not if the request series was cancelled while it was being sent
+        if request_series_id in self._response_series_by_id:
+            self._response_series_by_id[request_series_id] = response_series
+
+    async def _send_request_series_individually(
+        self,
+        connection: Connection,
+        pairs: list[Tuple[MCastRequestSeries, uuid.UUID]],
+        response_series_converter: Callable[[dict], MCastResponseSeries]
+    ) -> None:
+        label: str = connection.static.label
+        for pair_index, pair in enumerate(pairs):
+            try:
+                response_series: MCastResponseSeries = await mcast_websocket_send_recv(
+                    websocket=connection.dynamic.socket,
+                    request_series=pair[0],
+                    response_series_type=MCastResponseSeries,
+                    response_series_converter=response_series_converter)
+            except BaseException:
+                # Requeue the series not yet sent, ahead of anything pushed in the meantime
+                if label not in self._request_series_by_label:
+                    self._request_series_by_label[label] = list()
+                self._request_series_by_label[label][0:0] = pairs[pair_index:]
+                raise
+            if not response_series.requests_parsed or len(response_series.series) != len(pair[0].series):
+                message: str
+                if not response_series.requests_parsed:
+                    message = f"{label} could not parse the {len(pair[0].series)} requests sent to it."
+                else:
+                    message = \
+                        f"Sent {len(pair[0].series)} requests to {label} "\
+                        f"but received {len(response_series.series)} responses."
+                self.add_status_message(
+                    severity="error",
+                    message=message)
+                response_series = MCastResponseSeries(series=[ErrorResponse(message=message)])
+            response_series.responder = label
+            self._response_series_set_result(
+                request_series_id=pair[1],
+                response_series=response_series)
 
     async def do_update_frames_for_connections(
         self
     ) -> None:
-        connections = list(self._connections.values())
-        for connection in connections:
-            await self.do_update_frame_for_connection(connection=connection)
+        # Connections are updated concurrently so that their websocket round-trips overlap.
+        # All state shared between them is only touched from the event loop thread, so no locking is needed.
+        # Idle connections are filtered out here, so no coroutine or task is created for them each frame.
+        # The snapshot is still needed because connections may be removed while awaiting.
+        connections: list[Connector.Connection] = [
+            connection for connection in self._connections.values()
+            if connection.dynamic.status not in _CONNECTION_STATUSES_IDLE]
+        if len(connections) <= 0:
+            return
+        async with asyncio.TaskGroup() as task_group:
+            for connection in connections:
+                task_group.create_task(self._do_update_frame_for_connection_limited(connection=connection))
+
+    async def _do_update_frame_for_connection_limited(
+        self,
+        connection: Connection
+    ) -> None:
+        # Each role has its own concurrency limit, so that e.g. a slow detector sending large images
+        # cannot hold up the pose solvers. Errors are reported per connection and not propagated,
+        # so that one failing connection does not cancel the updates of the others.
+        try:
+            async with self._update_semaphores_by_role[connection.static.role]:
+                await self.do_update_frame_for_connection(connection=connection)
+        except Exception as e:
+            self.add_status_message(
+                severity="error",
+                message=f"Exception occurred while updating connection {connection.static.label}: {str(e)}")
@@ -1,20 +1,33 @@
-import datetime
 from typing import Final, Literal
 from websockets import WebSocketClientProtocol
 
 
 class ComponentConnectionDynamic:
+    __slots__ = (
+        "status",
+        "socket",
+        "attempt_count",
+        "next_attempt_deadline_ns")
 
-    ATTEMPT_COUNT_MAXIMUM: Final[int] = 3
-    ATTEMPT_TIME_GAP_SECONDS: Final[float] = 5.0
+    ATTEMPT_COUNT_MAXIMUM: Final[int] = 5  # Enough failed attempts for the gap to reach its maximum
+    ATTEMPT_TIME_GAP_SECONDS: Final[float] = 5.0  # Doubled after each consecutive failed attempt...
+    ATTEMPT_TIME_GAP_MAXIMUM_SECONDS: Final[float] = 30.0  # ... up to this
 
     status: Literal["disconnecting", "disconnected", "connecting", "connected", "aborted"]
     socket: WebSocketClientProtocol | None
     attempt_count: int
-    next_attempt_timestamp_utc: datetime.datetime
+    next_attempt_deadline_ns: int  # time.monotonic_ns()
 
     def __init__(self):
         self.status = "disconnected"
         self.socket = None
         self.attempt_count = 0
-        self.next_attempt_timestamp_utc = datetime.datetime.min
+        self.next_attempt_deadline_ns = 0
+
+    def next_attempt_time_gap_seconds(self) -> float:
+        """
+        Time to wait before the next attempt, given the current (failed) attempt_count
+        """
+        return min(
+            ComponentConnectionDynamic.ATTEMPT_TIME_GAP_MAXIMUM_SECONDS,
+            ComponentConnectionDynamic.ATTEMPT_TIME_GAP_SECONDS * 2 ** (self.attempt_count - 1))
@@ -1,10 +1,14 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
 
-class ConnectionTableRow(BaseModel):
-    label: str = Field()
-    role: str = Field()
-    ip_address: str = Field()
-    port: int = Field()
-    status: str = Field()
-
+@dataclass(slots=True, frozen=True)
+class ConnectionTableRow:
+    """
+    Built for every connection on every GUI update and never serialized,
+    so this is a plain dataclass rather than a pydantic model.
+    """
+    label: str
+    role: str
+    ip_address: str
+    port: int
+    status: str
@@ -35,10 +35,14 @@ from src.common import \
     MCastComponent, \
     MCastRequest, \
     MCastResponse
+from src.common.structures.capture_format import CaptureFormat
 from src.common.structures.capture_status import CaptureStatus
 from src.common.structures.marker_status import MarkerStatus
+import asyncio
 import logging
-from typing import Callable
+import numpy
+import threading
+from typing import Callable, Final
 
 from src.detector.implementations import \
     AbstractMarkerInterface, \
@@ -46,6 +50,10 @@ from src.detector.implementations import \
 
 logger = logging.getLogger(__name__)
 
+_CAPTURE_STATUS_RUNNING: Final[CaptureStatus.Status] = CaptureStatus.Status.RUNNING
+_MARKER_STATUS_RUNNING: Final[MarkerStatus.Status] = MarkerStatus.Status.RUNNING
+_UPDATE_COUNT_LOG_INTERVAL_MASK: Final[int] = 1024 - 1  # Update count is logged every 1024 updates
+
 class Detector(MCastComponent):
 
     _detector_configuration: DetectorConfiguration
@@ -56,6 +64,16 @@ class Detector(MCastComponent):
 
     _frame_count: int
 
+    _supported_request_types: dict[type[MCastRequest], Callable[[dict], MCastResponse]]
+
+    # Set while the capture is running, so that the update loop sleeps instead of polling while it is not
+    _capture_running_event: asyncio.Event
+
+    # Frames are captured on a worker thread while markers are detected in the previous frame.
+    # This lock keeps requests that reconfigure the camera from running during a capture.
+    _camera_lock: threading.Lock
+    _marker_source_frame_index: int  # index of the captured frame that markers were last detected in
+
     def __init__(
         self,
         detector_configuration: DetectorConfiguration,
@@ -70,24 +88,73 @@ class Detector(MCastComponent):
         self._detector_configuration = detector_configuration
         self._calibrator = Calibrator(calibrator_configuration)
         self._frame_count = 0
+        self._capture_running_event = asyncio.Event()
+        self._camera_lock = threading.Lock()
+        self._marker_source_frame_index = 0
 
         self._camera_interface = camera_interface
         self._marker_interface = marker_interface
 
-    def __del__(self):
-        self._camera_interface.__del__()
+        self._supported_request_types = self._build_supported_request_types()
+
+    async def aclose(self) -> None:
+        self._capture_running_event.clear()
+        # The lock is held by the capture thread for at most one frame
+        await asyncio.to_thread(self._close_camera_interface)
+
+    def _close_camera_interface(self) -> None:
+        with self._camera_lock:
+            self._camera_interface.close()
 
     async def internal_update(self):
-        if self._camera_interface._capture_status.status == CaptureStatus.Status.RUNNING:
-            self.internal_update_capture()
-        if self._marker_interface.marker_status.status == MarkerStatus.Status.RUNNING and \
-           self._camera_interface._captured_timestamp_utc > self._marker_interface.marker_timestamp_utc:
-            self.internal_update_marker_corners()
+        # The camera interface keeps the current frame valid while the next one is being captured
+        camera_interface: AbstractCameraInterface = self._camera_interface
+        captured_image = camera_interface._captured_image
+        captured_frame_index: int = camera_interface._captured_frame_index
+        # run_in_executor submits to the thread pool immediately, whereas a task wrapping to_thread would not
+        # start until the event loop regains control, i.e. only after the (blocking) detection below.
+        capture_future: asyncio.Future | None = None
+        if camera_interface._capture_status.status == _CAPTURE_STATUS_RUNNING:
+            capture_future = asyncio.get_running_loop().run_in_executor(None, self.internal_update_capture)
+        try:
+            if self._marker_interface.marker_status.status == _MARKER_STATUS_RUNNING and \
+               captured_image is not None and \
+               captured_frame_index != self._marker_source_frame_index:
+                self.internal_update_marker_corners(captured_image=captured_image)
+                self._marker_source_frame_index = captured_frame_index
+        finally:
+            # Even if detection fails, the capture must finish before the next update (or shutdown) proceeds
+            if capture_future is not None:
+                await capture_future
         self._frame_count += 1
-        if self._frame_count % 1000 == 0:
-            print(f"Update count: {self._frame_count}")
+        if (self._frame_count & _UPDATE_COUNT_LOG_INTERVAL_MASK) == 0:
+            logger.debug("Update count: %d", self._frame_count)
+
+    async def internal_update_loop(self):
+        """
+        Runs for the lifetime of the application. Acquiring a frame blocks until the camera delivers one,
+        so while capturing this runs once per camera frame, and while not capturing it does not run at all.
+        """
+        while True:
+            await self._capture_running_event.wait()
+            try:
+                await self.internal_update()
+            except Exception as e:
+                # Keep the loop alive, otherwise detection would stop silently for the rest of the session
+                logger.exception("Exception in internal update.")
+                self.add_status_message(
+                    severity="error",
+                    message=f"Exception in internal update: {str(e)}")
+            if self._camera_interface._capture_status.status != _CAPTURE_STATUS_RUNNING:
+                self._capture_running_event.clear()  # e.g. capture failure
+            await asyncio.sleep(0)  # Let pending requests be handled between frames
 
     def supported_request_types(self) -> dict[type[MCastRequest], Callable[[dict], MCastResponse]]:
+        # Invariant for the lifetime of the detector, and looked up for every request series.
+        # Callers must not modify the returned dict.
+        return self._supported_request_types
+
+    def _build_supported_request_types(self) -> dict[type[MCastRequest], Callable[[dict], MCastResponse]]:
         return_value: dict[type[MCastRequest], Callable[[dict], MCastResponse]] = super().supported_request_types()
         return_value.update({
 
@@ -119,17 +186,21 @@ class Detector(MCastComponent):
     # Camera
     def internal_update_capture(self):
         try:
-            self._camera_interface.internal_update_capture()
+            with self._camera_lock:
+                if self._camera_interface._capture_status.status == CaptureStatus.Status.RUNNING:
+                    self._camera_interface.internal_update_capture()
         except UpdateCaptureError as e:
             self.add_status_message(
                 severity=e.severity,
                 message=e.message)
 
     def set_capture_device(self, **kwargs) -> EmptyResponse | ErrorResponse:
-        return self._camera_interface.set_capture_device(**kwargs)
+        with self._camera_lock:
+            return self._camera_interface.set_capture_device(**kwargs)
         
     def set_capture_properties(self, **kwargs) -> EmptyResponse:
-        return self._camera_interface.set_capture_properties(**kwargs)
+        with self._camera_lock:
+            return self._camera_interface.set_capture_properties(**kwargs)
 
     def get_capture_device(self, **_kwargs) -> GetCaptureDeviceResponse:
         return self._camera_interface.get_capture_device(**_kwargs)
@@ -137,14 +208,23 @@ class Detector(MCastComponent):
     def get_capture_properties(self, **_kwargs) -> GetCapturePropertiesResponse | ErrorResponse:
         return self._camera_interface.get_capture_properties(**_kwargs)
 
-    def get_capture_image(self, **kwargs) -> GetCaptureImageResponse:
+    def get_capture_image(self, **kwargs) -> GetCaptureImageResponse | ErrorResponse:
         return self._camera_interface.get_capture_image(**kwargs)
 
+    def get_encoded_image(self, image_format: CaptureFormat) -> bytes | None:
+        return self._camera_interface.get_encoded_image(image_format=image_format)
+
     def start_capture(self, **kwargs) -> MCastResponse:
-        return self._camera_interface.start_capture(**kwargs)
+        with self._camera_lock:
+            response: MCastResponse = self._camera_interface.start_capture(**kwargs)
+        if self._camera_interface._capture_status.status == CaptureStatus.Status.RUNNING:
+            self._capture_running_event.set()
+        return response
 
     def stop_capture(self, **kwargs) -> MCastResponse:
-        return self._camera_interface.stop_capture(**kwargs)
+        self._capture_running_event.clear()
+        with self._camera_lock:
+            return self._camera_interface.stop_capture(**kwargs)
     
     # Marker
     def set_detection_parameters(self, **kwargs) -> EmptyResponse | ErrorResponse:
@@ -156,5 +236,5 @@ class Detector(MCastComponent):
     def get_marker_snapshots(self, **kwargs) -> GetMarkerSnapshotsResponse:
         return self._marker_interface.get_marker_snapshots(**kwargs)
 
-    def internal_update_marker_corners(self):
-        return self._marker_interface.internal_update_marker_corners(self._camera_interface._captured_image)
+    def internal_update_marker_corners(self, captured_image: numpy.ndarray):
+        return self._marker_interface.internal_update_marker_corners(captured_image)
@@ -7,8 +7,6 @@ from src.detector import \
     DetectorConfiguration
 from src.detector.api import \
     GetCaptureDeviceResponse, \
-    GetCaptureImageRequest, \
-    GetCaptureImageResponse, \
     GetCapturePropertiesResponse, \
     GetDetectionParametersResponse, \
     GetMarkerSnapshotsRequest, \
@@ -22,19 +20,33 @@ from src.detector.implementations import \
     AbstractCameraInterface, \
     AbstractMarkerInterface, \
     ArucoMarker
-import base64
-from fastapi import FastAPI, Request
+import asyncio
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.websockets import WebSocket
-from fastapi_utils.tasks import repeat_every
+import gc
 import hjson
 import logging
+import orjson
 import os
 
 
 logger = logging.getLogger(__name__)
 
 
+def load_configuration_dict(configuration_filepath: str) -> dict:
+    """
+    Configuration files are usually plain JSON, which orjson parses much faster than hjson.
+    hjson is only used for files that need its relaxed syntax (e.g. comments).
+    """
+    with open(configuration_filepath, 'rb') as infile:
+        configuration_file_contents: bytes = infile.read()
+    try:
+        return orjson.loads(configuration_file_contents)
+    except orjson.JSONDecodeError:
+        return hjson.loads(configuration_file_contents.decode("utf-8"))
+
+
 def create_app() -> FastAPI:
     detector_configuration_filepath: str = os.path.join(os.path.dirname(__file__), "..", "..", "data", "config.json")
     detector_configuration: DetectorConfiguration
@@ -44,15 +56,11 @@ def create_app() -> FastAPI:
     camera_interface: AbstractCameraInterface
     marker_interface: AbstractMarkerInterface
 
-    with open(detector_configuration_filepath, 'r') as infile:
-        detector_configuration_file_contents: str = infile.read()
-        detector_configuration_dict = hjson.loads(detector_configuration_file_contents)
-        detector_configuration = DetectorConfiguration(**detector_configuration_dict)
+    detector_configuration_dict: dict = load_configuration_dict(detector_configuration_filepath)
+    detector_configuration = DetectorConfiguration(**detector_configuration_dict)
 
-    with open(calibrator_configuration_filepath, 'r') as infile:  # Load calibrator configuration
-        calibrator_configuration_file_contents: str = infile.read()
-        calibrator_configuration_dict = hjson.loads(calibrator_configuration_file_contents)
-        calibrator_configuration = CalibratorConfiguration(**calibrator_configuration_dict)
+    calibrator_configuration_dict: dict = load_configuration_dict(calibrator_configuration_filepath)
+    calibrator_configuration = CalibratorConfiguration(**calibrator_configuration_dict)
 
     if detector_configuration.camera_implementation == OPENCV:
         from src.detector.implementations.usb_webcam_implementation import USBWebcamWithOpenCV
@@ -86,13 +94,15 @@ def create_app() -> FastAPI:
         return result
 
     @detector_app.get("/get_capture_image")
-    async def get_capture_image() -> GetCaptureImageResponse:
-        result: GetCaptureImageResponse = detector.get_capture_image(
-            request=GetCaptureImageRequest(format=".png"))
-        image_bytes = base64.b64decode(result.image_base64)
-        with open("test.png", "wb") as image_file:
-            image_file.write(image_bytes)
-        return result
+    async def get_capture_image() -> Response:
+        # Served as the raw image file, rather than base64 inside JSON
+        image_bytes: bytes | None = detector.get_encoded_image(image_format=".jpg")
+        if image_bytes is None:
+            return Response(
+                content=ErrorResponse(message="No image has been captured.").json(),
+                media_type="application/json",
+                status_code=503)
+        return Response(content=image_bytes, media_type="image/jpeg")
 
     @detector_app.get("/get_capture_properties")
     async def get_capture_properties() -> GetCapturePropertiesResponse:
@@ -143,9 +153,18 @@ def create_app() -> FastAPI:
         await detector.websocket_handler(websocket=websocket)
 
     @detector_app.on_event("startup")
-    @repeat_every(seconds=0.001)
-    async def internal_update() -> None:
-        await detector.internal_update()
+    async def start_internal_update() -> None:
+        # Objects created during startup (configuration, camera, calibration data...) live for the whole run,
+        # so they are moved out of the collector's generations rather than being rescanned during capture.
+        gc.freeze()
+        # Paced by the camera's frame delivery rather than by a timer.
+        # A reference is kept so that the task is not garbage collected.
+        detector_app.state.internal_update_task = asyncio.create_task(detector.internal_update_loop())
+
+    @detector_app.on_event("shutdown")
+    async def stop_internal_update() -> None:
+        detector_app.state.internal_update_task.cancel()
+        await detector.aclose()
 
     return detector_app
 
@@ -3,25 +3,44 @@ from src.common import \
     EmptyResponse, \
     ErrorResponse, \
     get_kwarg, \
+    ImageCoding, \
     MCastResponse
 from src.detector.api import \
     GetCaptureDeviceResponse, \
     GetCapturePropertiesResponse, \
     GetCaptureImageResponse, \
     GetCaptureImageRequest
+from src.common.structures.capture_format import CaptureFormat
 from src.common.structures.capture_status import CaptureStatus
 
-import base64
 import cv2
-import datetime
 import numpy
+from typing import Final
+try:
+    import simplejpeg  # libjpeg-turbo, considerably faster than cv2.imencode for JPEG
+except ImportError:
+    simplejpeg = None
+
+_JPEG_QUALITY: Final[int] = 95  # Same as the cv2.imencode default
 
 class AbstractCameraInterface(abc.ABC):
 
-    _captured_timestamp_utc: datetime.datetime
+    _captured_image: numpy.ndarray | None
+    _captured_timestamp_ns: int  # time.monotonic_ns()
+    _captured_frame_index: int  # incremented for each captured frame
     _capture_status: CaptureStatus  # internal bookkeeping
 
-    def __del__(self):
+    # Clients polling for images usually ask for the same frame more than once, or several clients ask at once,
+    # so the most recently encoded image of each format is kept: image format -> (frame index, encoded buffer)
+    _encoded_images_by_format: dict[CaptureFormat, tuple[int, bytes | numpy.ndarray]]
+
+    def __init__(self):
+        self._encoded_images_by_format = dict()
+
+    def close(self) -> None:
+        """
+        Stop any capture and release the device. Called explicitly on shutdown, rather than relying on __del__.
+        """
         pass
 
     def internal_update_capture(self) -> None:
@@ -45,7 +64,7 @@ class AbstractCameraInterface(abc.ABC):
     def stop_capture(self, **kwargs) -> MCastResponse:
         pass
 
-    def get_capture_image(self, **kwargs) -> GetCaptureImageResponse:
+    def get_capture_image(self, **kwargs) -> GetCaptureImageResponse | ErrorResponse:
         """
         :key request: GetCaptureImageRequest
         """
@@ -55,14 +74,67 @@ class AbstractCameraInterface(abc.ABC):
             key="request",
             arg_type=GetCaptureImageRequest)
 
-        encoded_frame: bool
-        encoded_image_rgb_single_row: numpy.array
-        encoded, encoded_image_rgb_single_row = cv2.imencode(request.format, self._captured_image)
-        encoded_image_rgb_bytes: bytes = encoded_image_rgb_single_row.tobytes()
-        encoded_image_rgb_base64 = base64.b64encode(encoded_image_rgb_bytes)
+        # base64 is encoded straight from the encoder's output buffer, without first copying it to bytes
+        encoded_image_rgb_buffer: bytes | numpy.ndarray | None = \
+            self._get_encoded_image_buffer(image_format=request.format)
+        if encoded_image_rgb_buffer is None:
+            return ErrorResponse(message="No image has been captured.")
+        encoded_image_rgb_base64: str = ImageCoding.bytes_to_base64(image_bytes=encoded_image_rgb_buffer)
         return GetCaptureImageResponse(
             format=request.format,
             image_base64=encoded_image_rgb_base64)
+
+    def get_encoded_image(self, image_format: CaptureFormat) -> bytes | None:
+        """
+        Encoded image file contents, for transports that can carry binary data directly (no base64).
+        None if there is no captured image.
+        """
+        encoded_image_buffer: bytes | numpy.ndarray | None = self._get_encoded_image_buffer(image_format=image_format)
+        if isinstance(encoded_image_buffer, numpy.ndarray):
+            return encoded_image_buffer.tobytes()
+        return encoded_image_buffer
+
+    def _get_encoded_image_buffer(self, image_format: CaptureFormat) -> bytes | numpy.ndarray | None:
+        captured_image: numpy.ndarray | None = self._captured_image
+        captured_frame_index: int = self._captured_frame_index
+        if captured_image is None:
+            return None
+        encoded_image: tuple[int, bytes | numpy.ndarray] | None = self._encoded_images_by_format.get(image_format)
+        if encoded_image is not None and encoded_image[0] == captured_frame_index:
+            return encoded_image[1]
+        encoded_image_buffer: bytes | numpy.ndarray = self._encode_image(
+            image=captured_image,
+            image_format=image_format)
+        # Unless the capture was stopped or reconfigured while encoding, which clears the cache meanwhile
+        if self._captured_image is captured_image:
+            self._encoded_images_by_format[image_format] = (captured_frame_index, encoded_image_buffer)
+        return encoded_image_buffer
+
+    def _invalidate_encoded_images(self) -> None:
+        """
+        To be called by implementations whenever the capture is started, stopped, or reconfigured
+        """
+        self._encoded_images_by_format.clear()
+
+    @staticmethod
+    def _encode_image(image: numpy.ndarray, image_format: CaptureFormat) -> bytes | numpy.ndarray:
+        if image_format == ".jpg" and simplejpeg is not None:
+            colorspace: str
+            if image.ndim == 2:
+                image = image[:, :, numpy.newaxis]
+                colorspace = "GRAY"
+            elif image.shape[2] == 4:
+                colorspace = "BGRX"
+            else:
+                colorspace = "BGR"
+            return simplejpeg.encode_jpeg(
+                numpy.ascontiguousarray(image),  # Only copies if e.g. the image is a cropped view
+                quality=_JPEG_QUALITY,
+                colorspace=colorspace)
+
+        encoded_image_rgb_single_row: numpy.array
+        _, encoded_image_rgb_single_row = cv2.imencode(image_format, image)
+        return encoded_image_rgb_single_row  # Only converted to bytes if a caller actually needs bytes
     
         # img_bytes = base64.b64decode(img_str)
         # img_buffer = numpy.frombuffer(img_bytes, dtype=numpy.uint8)
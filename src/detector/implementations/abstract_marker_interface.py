@@ -1,5 +1,4 @@
 import abc
-import datetime
 from src.common import \
     EmptyResponse, \
     ErrorResponse
@@ -12,7 +11,7 @@ from typing import Any
 
 class AbstractMarkerInterface(abc.ABC):
     marker_status: MarkerStatus  # internal bookkeeping
-    marker_timestamp_utc: datetime.datetime
+    marker_timestamp_ns: int  # time.monotonic_ns()
 
     def set_detection_parameters(self, **kwargs) -> EmptyResponse | ErrorResponse:
         pass
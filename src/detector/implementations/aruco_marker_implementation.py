@@ -17,11 +17,11 @@ from src.common.structures import \
 
 from src.common.structures import MarkerStatus
 
-import datetime
 import logging
 from typing import Any, Callable
 import cv2.aruco
 import numpy
+import time
 
 from src.detector.implementations import AbstractMarkerInterface
 
@@ -41,7 +41,7 @@ class ArucoMarker(AbstractMarkerInterface):
         self._marker_label_reverse_dictionary = dict()
         self._marker_detected_snapshots = list()  # Markers that are determined to be valid, and are identified
         self._marker_rejected_snapshots = list()  # Things that looked at first like markers but got later filtered out
-        self.marker_timestamp_utc = datetime.datetime.min
+        self.marker_timestamp_ns = 0
 
         self.marker_status = MarkerStatus
         self.marker_status.status = MarkerStatus.Status.STOPPED
@@ -211,12 +211,17 @@ class ArucoMarker(AbstractMarkerInterface):
             self.marker_status.status = MarkerStatus.Status.FAILURE
             return
 
-        image_greyscale = cv2.cvtColor(captured_image, cv2.COLOR_RGB2GRAY)
+        image_greyscale: numpy.ndarray
+        if captured_image.ndim == 2:
+            image_greyscale = captured_image  # Camera already delivers a single (luma) channel
+        else:
+            image_greyscale = cv2.cvtColor(captured_image, cv2.COLOR_RGB2GRAY)
         (detected_corner_points_raw, detected_dictionary_indices, rejected_corner_points_raw) = cv2.aruco.detectMarkers(
             image=image_greyscale,
             dictionary=self._marker_dictionary,
             parameters=self._marker_parameters)
 
+        corner_image_points: list[MarkerCornerImagePoint] = list()  # Stays empty if there are no candidates
         self._marker_detected_snapshots = list()
         # note: detected_indices is (inconsistently) None sometimes if no markers are detected
         if detected_dictionary_indices is not None and len(detected_dictionary_indices) > 0:
@@ -238,7 +243,7 @@ class ArucoMarker(AbstractMarkerInterface):
                 else:
                     marker_label: str = str(detected_marker_id)
                 corner_image_points_px = detected_corner_points_px[detected_marker_index]
-                corner_image_points: list[MarkerCornerImagePoint] = \
+                corner_image_points = \
                     self._marker_corner_image_point_list_from_embedded_list(
                         corner_image_points_px=corner_image_points_px.tolist())
                 self._marker_detected_snapshots.append(MarkerSnapshot(
@@ -250,14 +255,14 @@ class ArucoMarker(AbstractMarkerInterface):
             rejected_corner_points_px = numpy.array(rejected_corner_points_raw).reshape((-1, 4, 2))
             for rejected_marker_index in range(rejected_corner_points_px.shape[0]):
                 corner_image_points_px = rejected_corner_points_px[rejected_marker_index]
-                corner_image_points: list[MarkerCornerImagePoint] = \
+                corner_image_points = \
                     self._marker_corner_image_point_list_from_embedded_list(
                         corner_image_points_px=corner_image_points_px.tolist())
                 self._marker_rejected_snapshots.append(MarkerSnapshot(
                     label=f"unknown",
                     corner_image_points=corner_image_points))
 
-        self.marker_timestamp_utc = datetime.datetime.utcnow()
+        self.marker_timestamp_ns = time.monotonic_ns()
         return corner_image_points
 
     @staticmethod
@@ -12,64 +12,128 @@ from src.common.structures.capture_status import CaptureStatus
 
 from src.detector.implementations import AbstractCameraInterface
 
-from picamera2 import Picamera2
+from picamera2 import MappedArray, Picamera2
 from picamera2.controls import Controls
 
-import datetime
+import contextlib
 import logging
 import numpy
+import time
+from typing import Final
 
 logger = logging.getLogger(__name__)
 
+_CAPTURE_FORMAT: Final[str] = "YUV420"
+
+# Two buffers are held by the double buffer below, and one is left for the camera to fill.
+# Fewer buffers means fewer frames that can be waiting (and getting older) between captures.
+_CAPTURE_BUFFER_COUNT: Final[int] = 3
+
+_MICROSECONDS_PER_SECOND: Final[int] = 1_000_000
+
+# camera_controls values are (minimum, maximum, default)
+_CONTROL_RANGE_MINIMUM_INDEX: Final[int] = 0
+_CONTROL_RANGE_MAXIMUM_INDEX: Final[int] = 1
+_CONTROL_RANGE_DEFAULT_INDEX: Final[int] = 2
+
+# SetCapturePropertiesRequest/GetCapturePropertiesResponse fields that map directly onto a picamera2 control
+_CONTROL_NAME_BY_REQUEST_FIELD: Final[dict[str, str]] = {
+    "auto_exposure": "AeEnable",
+    "exposure": "ExposureValue",
+    "brightness": "Brightness",
+    "contrast": "Contrast",
+    "sharpness": "Sharpness"}
+
 class PiCamera(AbstractCameraInterface):
 
     _camera: Picamera2
-    _captured_image: numpy.ndarray | None
-    _captured_timestamp_utc: datetime.datetime
+    _captured_image: numpy.ndarray | None  # luma view into the current request's buffer, valid until released
+    # Double buffer: The current frame's buffer stays mapped while the next frame is captured,
+    # so that it can still be read (e.g. for marker detection) during that time.
+    _captured_request_contexts: tuple[contextlib.ExitStack, contextlib.ExitStack]
+    _captured_request_index: int  # into _captured_request_contexts, for the current frame
+    _captured_timestamp_ns: int  # time.monotonic_ns()
+    _captured_frame_index: int  # incremented for each captured frame
     _capture_status: CaptureStatus  # internal bookkeeping
     _camera_controls: Controls
+    _control_ranges: dict[str, tuple]  # control name to (minimum, maximum), read once from camera_controls
+    # Rows, columns of the luma plane at the configured resolution. Built when configuring rather than per frame.
+    _captured_image_region: tuple[slice, slice]
+    # Properties only change through set_capture_properties, which clears this, so polling clients reuse it
+    _capture_properties_response: GetCapturePropertiesResponse | None
 
     def __init__(self):
+        super().__init__()
         self._captured_image = None
-        self._captured_timestamp_utc = datetime.datetime.min
+        self._captured_request_contexts = (contextlib.ExitStack(), contextlib.ExitStack())
+        self._captured_request_index = 0
+        self._captured_timestamp_ns = 0
+        self._captured_frame_index = 0
+        self._capture_properties_response = None
 
         self._capture_status = CaptureStatus()
         self._capture_status.status = CaptureStatus.Status.STOPPED
 
         self._camera = Picamera2()
-        self._camera.configure("video")
-
-        default_value_index: int = 2
-        default_brightness = self._camera.camera_controls['Brightness'][default_value_index]
-        default_contrast = self._camera.camera_controls['Contrast'][default_value_index]
-        default_sharpness = self._camera.camera_controls['Sharpness'][default_value_index]
-        default_auto_exposure = self._camera.camera_controls['AeEnable'][default_value_index]
-        default_exposure = self._camera.camera_controls['ExposureValue'][default_value_index]
-
+        # Marker detection only needs luminance, and the Y plane of YUV420 can be used directly as greyscale
+        self._camera.video_configuration.main.format = _CAPTURE_FORMAT
+        self._camera.video_configuration.buffer_count = _CAPTURE_BUFFER_COUNT
+        # Do not hold on to a completed frame for the next capture_request(), which then always waits for a new one
+        self._camera.video_configuration.queue = False
+        self._configure()
+
+        # picamera2 rebuilds camera_controls from libcamera on every access, so read it only once
+        camera_controls: dict[str, tuple] = self._camera.camera_controls
         self._camera_controls = Controls(self._camera)
-
-        self._camera_controls.Brightness = default_brightness
-        self._camera_controls.Contrast = default_contrast
-        self._camera_controls.Sharpness = default_sharpness
-        self._camera_controls.AeEnable = default_auto_exposure
-        self._camera_controls.ExposureValue = default_exposure
+        self._control_ranges = dict()
+        for control_name in _CONTROL_NAME_BY_REQUEST_FIELD.values():
+            self._control_ranges[control_name] = (
+                camera_controls[control_name][_CONTROL_RANGE_MINIMUM_INDEX],
+                camera_controls[control_name][_CONTROL_RANGE_MAXIMUM_INDEX])
+            setattr(
+                self._camera_controls,
+                control_name,
+                camera_controls[control_name][_CONTROL_RANGE_DEFAULT_INDEX])
 
         self._camera.set_controls(self._camera_controls)
 
-    def __del__(self):
-        if self._captured_image is not None:
-            self._captured_image = numpy.empty()
+    def _configure(self) -> None:
+        self._camera.configure("video")
+        width_px, height_px = self._camera.video_configuration.main.size
+        self._captured_image_region = (slice(0, height_px), slice(0, width_px))
 
-    def internal_update_capture(self) -> None:
-        self._captured_image = self._camera.capture_array()
+    def close(self) -> None:
+        self._release_captured_request()
+        self._capture_status.status = CaptureStatus.Status.STOPPED
+        self._camera.close()  # Also stops the camera if it is running
+
+    def _release_captured_request(self) -> None:
+        # The image is a view into the request's buffer, so it must not outlive the request
+        self._captured_image = None
+        for captured_request_context in self._captured_request_contexts:
+            captured_request_context.close()
 
-        if self._captured_image is None:
-            message: str = "Failed to grab frame."
-            self._status.capture_errors.append(message)
+    def internal_update_capture(self) -> None:
+        # Rather than capture_array(), which copies each frame out of the camera's buffer,
+        # the buffer is mapped and kept for two frames, and the image is a view into it.
+        next_request_index: int = 1 - self._captured_request_index
+        captured_request_context: contextlib.ExitStack = self._captured_request_contexts[next_request_index]
+        captured_request_context.close()  # Frame before the current one
+        # capture_request() raises on failure rather than returning None
+        try:
+            request = self._camera.capture_request()
+        except Exception as e:
+            message: str = f"Failed to grab frame: {str(e)}"
+            self._capture_status.errors.append(message)
             self._capture_status.status = CaptureStatus.Status.FAILURE
-            raise UpdateCaptureError(severity="error", message=message)
+            raise UpdateCaptureError(severity="error", message=message) from e
 
-        self._captured_timestamp_utc = datetime.datetime.utcnow()
+        captured_request_context.callback(request.release)
+        mapped_array: MappedArray = captured_request_context.enter_context(MappedArray(request, "main"))
+        self._captured_image = mapped_array.array[self._captured_image_region]
+        self._captured_timestamp_ns = time.monotonic_ns()
+        self._captured_frame_index += 1
+        self._captured_request_index = next_request_index
 
     def set_capture_device(self, **kwargs) -> EmptyResponse | ErrorResponse:
         return EmptyResponse()
@@ -85,59 +149,73 @@ class PiCamera(AbstractCameraInterface):
             key="request",
             arg_type=SetCapturePropertiesRequest)
 
-        if self._captured_image is not None:
+        self._capture_properties_response = None
+        self._invalidate_encoded_images()
+        if self._capture_status.status == CaptureStatus.Status.RUNNING:
 
-            self._camera.stop()
-            if request.resolution_x_px is not None and request.resolution_y_px is not None:
-                self._camera.video_configuration.size = (request.resolution_x_px,request.resolution_y_px)
+            # Only changed controls are sent, and they take effect on a running camera
+            changed_controls: dict[str, object] = dict()
             if request.fps is not None:
                 self._camera.video_configuration.controls.FrameRate = request.fps
-            self._camera.configure("video")
-
-            if request.auto_exposure is not None:
-                self._camera_controls.AeEnable = request.auto_exposure
-            # TODO: how to enforce values in gui be entered in the proper range?
-            if request.exposure is not None:
-                self._camera_controls.ExposureValue = request.exposure
-            if request.brightness is not None:
-                self._camera_controls.Brightness = request.brightness
-            if request.contrast is not None:
-                self._camera_controls.Contrast = request.contrast
-            if request.sharpness is not None:
-                self._camera_controls.Sharpness = request.sharpness
-
-            self._camera.set_controls(self._camera_controls)
-            self._camera.start()
+                changed_controls["FrameRate"] = request.fps
+
+            # Values entered outside of the camera's range are clamped to it
+            for request_field, control_name in _CONTROL_NAME_BY_REQUEST_FIELD.items():
+                value = getattr(request, request_field)
+                if value is not None:
+                    minimum, maximum = self._control_ranges[control_name]
+                    if minimum is not None and maximum is not None:
+                        value = min(max(value, minimum), maximum)
+                    setattr(self._camera_controls, control_name, value)
+                    changed_controls[control_name] = value
+
+            if request.resolution_x_px is not None and request.resolution_y_px is not None:
+                # A new resolution requires the camera to be stopped and reconfigured
+                self._release_captured_request()
+                self._camera.stop()
+                self._camera.video_configuration.size = (request.resolution_x_px, request.resolution_y_px)
+                self._configure()
+                self._camera.set_controls(self._camera_controls)
+                self._camera.start()
+            elif len(changed_controls) > 0:
+                self._camera.set_controls(changed_controls)
         return EmptyResponse()
 
     def get_capture_device(self, **_kwargs) -> GetCaptureDeviceResponse:
         return GetCaptureDeviceResponse(capture_device_id=str("N/A"))
 
     def get_capture_properties(self, **_kwargs) -> GetCapturePropertiesResponse | ErrorResponse:
-        if self._captured_image is None:
+        if self._capture_status.status != CaptureStatus.Status.RUNNING:
             return ErrorResponse(
                 message="The capture is not active, and properties cannot be retrieved.")
+        elif self._capture_properties_response is not None:
+            return self._capture_properties_response
         else:
+            # Control values are converted to the response's field types by pydantic
+            video_configuration = self._camera.video_configuration
+            camera_controls: Controls = self._camera_controls
+            # Setting FrameRate stores it as FrameDurationLimits, which is always present in the configuration
+            frame_duration_limits_us: tuple[int, int] = video_configuration.controls.FrameDurationLimits
+            frame_duration_us: float = 0.5 * (frame_duration_limits_us[0] + frame_duration_limits_us[1])
             ret = GetCapturePropertiesResponse(
-                resolution_x_px=int(self._camera.video_configuration.size[0]),
-                resolution_y_px=int(self._camera.video_configuration.size[1]),
-                fps=int(round(self._camera.video_configuration.controls.FrameRate)),
-                brightness=self._camera_controls.Brightness,
-                auto_exposure=bool(self._camera_controls.AeEnable),
-                exposure=int(self._camera_controls.ExposureValue),
-                contrast=self._camera_controls.Contrast,
-                sharpness=self._camera_controls.Sharpness)
+                resolution_x_px=int(video_configuration.size[0]),
+                resolution_y_px=int(video_configuration.size[1]),
+                fps=int(round(_MICROSECONDS_PER_SECOND / frame_duration_us)),
+                **{response_field: getattr(camera_controls, control_name)
+                   for response_field, control_name in _CONTROL_NAME_BY_REQUEST_FIELD.items()})
+            self._capture_properties_response = ret
             return ret
 
     def start_capture(self, **kwargs) -> MCastResponse:
+        self._invalidate_encoded_images()
         self._camera.start()
-        self._captured_image = self._camera.capture_array()
         self._capture_status.status = CaptureStatus.Status.RUNNING
+        self.internal_update_capture()
         return EmptyResponse()
 
     def stop_capture(self, **kwargs) -> MCastResponse:
-        if self._captured_image is not None:
-            self._captured_image = None
+        self._invalidate_encoded_images()
+        self._release_captured_request()
         self._capture_status.status = CaptureStatus.Status.STOPPED
         self._camera.stop()
         return EmptyResponse()
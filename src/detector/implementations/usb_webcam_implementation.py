@@ -14,10 +14,10 @@ from src.common.structures.capture_status import CaptureStatus
 from src.detector.implementations import AbstractCameraInterface
 
 import cv2
-import datetime
 import logging
 import numpy
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -25,22 +25,27 @@ class USBWebcamWithOpenCV(AbstractCameraInterface):
 
     _capture: cv2.VideoCapture | None
     _captured_image: numpy.ndarray | None
-    _captured_timestamp_utc: datetime.datetime
+    _captured_timestamp_ns: int  # time.monotonic_ns()
+    _captured_frame_index: int  # incremented for each captured frame
     _capture_device_id: str | int
     _capture_status: CaptureStatus  # internal bookkeeping
 
     def __init__(self, _capture_device_id):
+        super().__init__()
         self._capture = None
         self._captured_image = None
-        self._captured_timestamp_utc = datetime.datetime.min
+        self._captured_timestamp_ns = 0
+        self._captured_frame_index = 0
         self._capture_device_id = _capture_device_id
 
         self._capture_status = CaptureStatus()
         self._capture_status.status = CaptureStatus.Status.STOPPED
 
-    def __del__(self):
+    def close(self) -> None:
         if self._capture is not None:
             self._capture.release()
+            self._capture = None
+        self._capture_status.status = CaptureStatus.Status.STOPPED
 
     def _detect_os_and_open_video(self,capture_device_id):
         # cv2.CAP_DSHOW does not work on linux, but is necessary on windows
@@ -68,7 +73,8 @@ class USBWebcamWithOpenCV(AbstractCameraInterface):
             self._capture_status.status = CaptureStatus.Status.FAILURE
             raise UpdateCaptureError(severity="error", message=message)
 
-        self._captured_timestamp_utc = datetime.datetime.utcnow()
+        self._captured_timestamp_ns = time.monotonic_ns()
+        self._captured_frame_index += 1
 
     def set_capture_device(self, **kwargs) -> EmptyResponse | ErrorResponse:
         """
@@ -84,6 +90,7 @@ class USBWebcamWithOpenCV(AbstractCameraInterface):
         if input_device_id.isnumeric():
             input_device_id = int(input_device_id)
         if self._capture_device_id != input_device_id:
+            self._invalidate_encoded_images()
             self._capture_device_id = input_device_id
             if self._capture is not None:
                 self._capture.release()
@@ -104,6 +111,7 @@ class USBWebcamWithOpenCV(AbstractCameraInterface):
             key="request",
             arg_type=SetCapturePropertiesRequest)
 
+        self._invalidate_encoded_images()
         if self._capture is not None:
             if request.resolution_x_px is not None:
                 self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, float(request.resolution_x_px))
@@ -151,6 +159,7 @@ class USBWebcamWithOpenCV(AbstractCameraInterface):
         if self._capture is not None:
             return EmptyResponse()
 
+        self._invalidate_encoded_images()
         self._capture = self._detect_os_and_open_video(self._capture_device_id)
         # NOTE: The USB3 cameras bought for this project appear to require some basic parameters to be set,
         #       otherwise frame grab results in error
@@ -163,6 +172,7 @@ class USBWebcamWithOpenCV(AbstractCameraInterface):
         return EmptyResponse()
 
     def stop_capture(self, **kwargs) -> MCastResponse:
+        self._invalidate_encoded_images()
         if self._capture is not None:
             self._capture.release()
             self._capture = None
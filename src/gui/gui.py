@@ -147,4 +147,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop is installed alongside uvicorn[standard] where it is supported (i.e. not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -28,7 +28,9 @@ from src.pose_solver.api import \
     SetReferenceMarkerRequest
 import datetime
 import logging
+import orjson
 import platform
+import time
 from typing import Final, Optional
 import uuid
 import wx
@@ -39,6 +41,19 @@ logger = logging.getLogger(__name__)
 
 POSE_REPRESENTATIVE_MODEL: Final[str] = "coordinate_axes"
 
+# The update loop runs about once per GUI frame, but the tracking table and scene need not be rebuilt that often
+_TRACKED_TARGET_POSES_UPDATE_INTERVAL_SECONDS: Final[float] = 0.05
+
+
+def _tracking_table_row(pose: Pose, label: str) -> TrackingTableRow:
+    x, y, z = pose.object_to_reference_matrix.translation()
+    return TrackingTableRow(
+        target_id=pose.target_id,
+        label=label,
+        x=x,
+        y=y,
+        z=z)
+
 
 class PoseSolverPanel(BasePanel):
 
@@ -60,8 +75,11 @@ class PoseSolverPanel(BasePanel):
     _is_waiting_for_connector: bool
     _latest_detector_frames: dict[str, DetectorFrame]  # last frame for each detector
     _latest_pose_solver_frames: dict[str, PoseSolverFrame]
+    _pose_solver_labels: list[str]  # options currently in _pose_solver_selector
     _target_id_to_label: dict[str, str]
     _tracked_target_poses: list[Pose]
+    _tracked_target_poses_outdated: bool  # new poses were received since the table and scene were last rebuilt
+    _tracked_target_poses_update_time_seconds: float  # time.monotonic()
 
     def __init__(
         self,
@@ -82,8 +100,11 @@ class PoseSolverPanel(BasePanel):
         self._is_waiting_for_connector = False
         self._latest_detector_frames = dict()
         self._latest_pose_solver_frames = dict()
+        self._pose_solver_labels = list()
         self._target_id_to_label = dict()
         self._tracked_target_poses = list()
+        self._tracked_target_poses_outdated = False
+        self._tracked_target_poses_update_time_seconds = 0.0
 
         horizontal_split_sizer: wx.BoxSizer = wx.BoxSizer(orient=wx.HORIZONTAL)
 
@@ -271,7 +292,10 @@ class PoseSolverPanel(BasePanel):
         super().on_page_select()
         selected_pose_solver_label: str = self._pose_solver_selector.selector.GetStringSelection()
         available_pose_solver_labels: list[str] = self._connector.get_connected_pose_solver_labels()
-        self._pose_solver_selector.set_options(option_list=available_pose_solver_labels)
+        # Replacing the options clears and refills the wx.Choice, so it is only done if they changed
+        if available_pose_solver_labels != self._pose_solver_labels:
+            self._pose_solver_selector.set_options(option_list=available_pose_solver_labels)
+            self._pose_solver_labels = available_pose_solver_labels
         if selected_pose_solver_label in available_pose_solver_labels:
             self._pose_solver_selector.selector.SetStringSelection(selected_pose_solver_label)
         else:
@@ -308,8 +332,12 @@ class PoseSolverPanel(BasePanel):
             return
         selected_index: int | None = self._tracking_table.get_selected_row_index()
         if selected_index is not None:
-            if 0 <= selected_index < len(self._tracked_target_poses):
-                display_text: str = self._tracked_target_poses[selected_index].json(indent=4)
+            tracked_target_poses: list[Pose] = self._tracked_target_poses
+            if 0 <= selected_index < len(tracked_target_poses):
+                # orjson only supports indenting by 2 spaces, but is much faster than pydantic's json.dumps
+                display_text: str = orjson.dumps(
+                    tracked_target_poses[selected_index].dict(),
+                    option=orjson.OPT_INDENT_2).decode()
                 self._tracking_display_textbox.SetValue(display_text)
             else:
                 self.status_message_source.enqueue_status_message(
@@ -346,7 +374,8 @@ class PoseSolverPanel(BasePanel):
                 ui_needs_update = True
                 self._is_waiting_for_connector = False
 
-        if self._connector.is_running():
+        is_running: bool = self._connector.is_running()
+        if is_running:
             detector_labels: list[str] = self._connector.get_connected_detector_labels()
             for detector_label in detector_labels:
                 retrieved_detector_frame: DetectorFrame = self._connector.get_live_detector_frame(
@@ -376,48 +405,48 @@ class PoseSolverPanel(BasePanel):
                     self._latest_pose_solver_frames[pose_solver_label] = retrieved_pose_solver_frame
                     new_poses_available = True
             if new_poses_available:
-                self._tracked_target_poses.clear()
-                if self._renderer is not None:
-                    self._renderer.clear_scene_objects()
-                    self._renderer.add_scene_object(  # Reference
+                self._tracked_target_poses_outdated = True
+
+        # Throttled while running. Once tracking stops, a pending rebuild is flushed right away,
+        # so that the final poses are drawn even if tracking stopped within the interval.
+        now_seconds: float = time.monotonic()
+        if self._tracked_target_poses_outdated and (
+           not is_running or
+           now_seconds - self._tracked_target_poses_update_time_seconds >=
+           _TRACKED_TARGET_POSES_UPDATE_INTERVAL_SECONDS):
+            self._tracked_target_poses_outdated = False
+            self._tracked_target_poses_update_time_seconds = now_seconds
+            # Bound locally, since they are used for every pose
+            tracked_target_poses: list[Pose] = self._tracked_target_poses
+            renderer: GraphicsRenderer | None = self._renderer
+            tracked_target_poses.clear()
+            if renderer is not None:
+                renderer.clear_scene_objects()
+                renderer.add_scene_object(  # Reference
+                    model_key=POSE_REPRESENTATIVE_MODEL,
+                    transform_to_world=Matrix4x4())
+            table_rows: list[TrackingTableRow] = list()
+            target_id_to_label: dict[str, str] = self._target_id_to_label
+            for live_pose_solver in self._latest_pose_solver_frames.values():
+                table_rows += [
+                    _tracking_table_row(pose=pose, label=target_id_to_label.get(pose.target_id, str()))
+                    for pose in live_pose_solver.target_poses]
+                table_rows += [
+                    _tracking_table_row(pose=pose, label=pose.target_id)
+                    for pose in live_pose_solver.detector_poses]
+                # Same order as the table rows, so that a selected row's index is also its pose's index
+                tracked_target_poses += live_pose_solver.target_poses
+                tracked_target_poses += live_pose_solver.detector_poses
+            if renderer is not None:
+                for pose in tracked_target_poses:
+                    renderer.add_scene_object(
                         model_key=POSE_REPRESENTATIVE_MODEL,
-                        transform_to_world=Matrix4x4())
-                table_rows: list[TrackingTableRow] = list()
-                for live_pose_solver in self._latest_pose_solver_frames.values():
-                    for pose in live_pose_solver.target_poses:
-                        label: str = str()
-                        if pose.target_id in self._target_id_to_label:
-                            label = self._target_id_to_label[pose.target_id]
-                        table_row: TrackingTableRow = TrackingTableRow(
-                            target_id=pose.target_id,
-                            label=label,
-                            x=pose.object_to_reference_matrix[0, 3],
-                            y=pose.object_to_reference_matrix[1, 3],
-                            z=pose.object_to_reference_matrix[2, 3])
-                        table_rows.append(table_row)
-                        self._tracked_target_poses.append(pose)
-                        if self._renderer is not None:
-                            self._renderer.add_scene_object(
-                                model_key=POSE_REPRESENTATIVE_MODEL,
-                                transform_to_world=pose.object_to_reference_matrix)
-                    for pose in live_pose_solver.detector_poses:
-                        table_row: TrackingTableRow = TrackingTableRow(
-                            target_id=pose.target_id,
-                            label=pose.target_id,
-                            x=pose.object_to_reference_matrix[0, 3],
-                            y=pose.object_to_reference_matrix[1, 3],
-                            z=pose.object_to_reference_matrix[2, 3])
-                        table_rows.append(table_row)
-                        self._tracked_target_poses.append(pose)
-                        if self._renderer is not None:
-                            self._renderer.add_scene_object(
-                                model_key=POSE_REPRESENTATIVE_MODEL,
-                                transform_to_world=pose.object_to_reference_matrix)
-                self._tracking_table.update_contents(row_contents=table_rows)
-                if len(table_rows) > 0:
-                    self._tracking_table.Enable(True)
-                else:
-                    self._tracking_table.Enable(False)
+                        transform_to_world=pose.object_to_reference_matrix)
+            self._tracking_table.update_contents(row_contents=table_rows)
+            if len(table_rows) > 0:
+                self._tracking_table.Enable(True)
+            else:
+                self._tracking_table.Enable(False)
 
         if len(self._active_request_ids) > 0:
             completed_request_ids: list[uuid.UUID] = list()
@@ -435,35 +464,32 @@ class PoseSolverPanel(BasePanel):
         self._is_updating = False
 
     def _update_controls(self) -> None:
-        self._pose_solver_selector.Enable(False)
-        self._reference_marker_id_spinbox.Enable(False)
-        self._reference_target_submit_button.Enable(False)
-        self._tracked_marker_id_spinbox.Enable(False)
-        self._tracked_target_submit_button.Enable(False)
-        self._tracking_start_button.Enable(False)
-        self._tracking_stop_button.Enable(False)
-        self._tracking_table.Enable(False)
-        self._tracking_display_textbox.Enable(False)
-        if len(self._active_request_ids) > 0 or self._connector.is_in_transition():
-            return  # We're waiting for something
-        self._pose_solver_selector.Enable(True)
-        self._reference_marker_id_spinbox.Enable(True)
-        self._reference_target_submit_button.Enable(True)
-        self._tracked_marker_id_spinbox.Enable(True)
-        self._tracked_target_submit_button.Enable(True)
-        if not self._connector.is_running():
-            self._tracking_start_button.Enable(True)
-        else:
-            self._tracking_stop_button.Enable(True)
-        if len(self._tracked_target_poses) > 0:
-            self._tracking_table.Enable(True)
+        # Each control's state is decided first and then applied with a single Enable() call.
+        # Disabling everything and then re-enabling most of it would generate events and repaints
+        # even for controls whose state does not change.
+        is_waiting: bool = len(self._active_request_ids) > 0 or self._connector.is_in_transition()
+        is_running: bool = self._connector.is_running()
+        tracked_target_count: int = len(self._tracked_target_poses)
+        tracking_table_enabled: bool = False
+        tracking_display_enabled: bool = False
+        if not is_waiting and tracked_target_count > 0:
+            tracking_table_enabled = True
             tracked_target_index: int = self._tracking_table.get_selected_row_index()
             if tracked_target_index is not None:
-                if tracked_target_index >= len(self._tracked_target_poses):
+                if tracked_target_index >= tracked_target_count:
                     self.status_message_source.enqueue_status_message(
                         severity="warning",
                         message=f"Selected tracked target index {tracked_target_index} is out of bounds. "
                                 "Setting to None.")
                     self._tracking_table.set_selected_row_index(None)
                 else:
-                    self._tracking_display_textbox.Enable(True)
+                    tracking_display_enabled = True
+        self._pose_solver_selector.Enable(not is_waiting)
+        self._reference_marker_id_spinbox.Enable(not is_waiting)
+        self._reference_target_submit_button.Enable(not is_waiting)
+        self._tracked_marker_id_spinbox.Enable(not is_waiting)
+        self._tracked_target_submit_button.Enable(not is_waiting)
+        self._tracking_start_button.Enable(not is_waiting and not is_running)
+        self._tracking_stop_button.Enable(not is_waiting and is_running)
+        self._tracking_table.Enable(tracking_table_enabled)
+        self._tracking_display_textbox.Enable(tracking_display_enabled)
@@ -78,14 +78,19 @@ class RowSelectionTable(wx.Panel, Generic[T], metaclass=_RowSelectionTableMeta):
         self,
         row_contents: list[T]
     ):
-        self.table.ClearSelection()
-        row_count: int = self.table.GetNumberRows()
-        if row_count > 0:
-            self.table.DeleteRows(numRows=row_count)
-
-        self.table.AppendRows(numRows=len(row_contents))
-        for row_index, row_content in enumerate(row_contents):
-            self._set_row_contents(row_index, row_content)
+        # Batched so that the grid is repainted once, rather than for every row and cell that changes
+        self.table.BeginBatch()
+        try:
+            self.table.ClearSelection()
+            row_count: int = self.table.GetNumberRows()
+            if row_count > 0:
+                self.table.DeleteRows(numRows=row_count)
+
+            self.table.AppendRows(numRows=len(row_contents))
+            for row_index, row_content in enumerate(row_contents):
+                self._set_row_contents(row_index, row_content)
+        finally:
+            self.table.EndBatch()
         self.auto_size_columns_and_fit()
         self.update_selection()
 
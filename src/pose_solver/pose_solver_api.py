@@ -42,6 +42,8 @@ class PoseSolverAPI(MCastComponent):
     _status: PoseSolverStatus
     _pose_solver: PoseSolver
 
+    _supported_request_types: dict[type[MCastRequest], Callable[[dict], MCastResponse]]
+
     def __init__(
         self,
         configuration: PoseSolverConfiguration,
@@ -53,11 +55,16 @@ class PoseSolverAPI(MCastComponent):
         self._pose_solver = pose_solver
         self._status = PoseSolverStatus()
 
+        self._supported_request_types = self._build_supported_request_types()
+
     async def internal_update(self):
         if self._status.solve_status == PoseSolverStatus.Solve.RUNNING:
             self._pose_solver.update()
 
     def supported_request_types(self) -> dict[type[MCastRequest], Callable[[dict], MCastResponse]]:
+        return self._supported_request_types
+
+    def _build_supported_request_types(self) -> dict[type[MCastRequest], Callable[[dict], MCastResponse]]:
         return_value: dict[type[MCastRequest], Callable[[dict], MCastResponse]] = super().supported_request_types()
         return_value.update({
             AddMarkerCornersRequest: self.add_marker_corners,
@@ -0,0 +1,24 @@
+from src.connector.structures import ComponentConnectionDynamic
+import unittest
+
+
+class TestComponentConnectionDynamic(unittest.TestCase):
+
+    def test_next_attempt_time_gap_sequence(self):
+        dynamic: ComponentConnectionDynamic = ComponentConnectionDynamic()
+        time_gaps_seconds: list[float] = list()
+        # The connector only schedules another attempt while attempt_count is below the maximum
+        for attempt_count in range(1, ComponentConnectionDynamic.ATTEMPT_COUNT_MAXIMUM):
+            dynamic.attempt_count = attempt_count
+            time_gaps_seconds.append(dynamic.next_attempt_time_gap_seconds())
+
+        self.assertEqual(time_gaps_seconds, [5.0, 10.0, 20.0, 30.0])
+        # The maximum gap must be reachable before the connection is aborted
+        self.assertEqual(time_gaps_seconds[-1], ComponentConnectionDynamic.ATTEMPT_TIME_GAP_MAXIMUM_SECONDS)
+
+    def test_next_attempt_time_gap_is_capped(self):
+        dynamic: ComponentConnectionDynamic = ComponentConnectionDynamic()
+        dynamic.attempt_count = 100
+        self.assertEqual(
+            dynamic.next_attempt_time_gap_seconds(),
+            ComponentConnectionDynamic.ATTEMPT_TIME_GAP_MAXIMUM_SECONDS)
@@ -0,0 +1,44 @@
+from src.common import MCastResponseSeries
+from src.common.api.mcast_json_dumps import mcast_json_dumps
+from src.common.structures import \
+    Matrix4x4, \
+    Pose
+from src.pose_solver.api import GetPosesResponse
+import datetime
+import json
+import numpy
+import unittest
+
+
+def _default(value):
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class TestMCastJsonDumps(unittest.TestCase):
+
+    def test_numpy_scalars(self):
+        value: dict = {
+            "float64": numpy.float64(1.5),
+            "float32": numpy.float32(0.25),
+            "int64": numpy.int64(3)}
+        result: str = mcast_json_dumps(value, default=_default)
+        self.assertEqual(json.loads(result), {"float64": 1.5, "float32": 0.25, "int64": 3})
+
+    def test_stdlib_keyword_arguments(self):
+        value: dict = {"values": [numpy.float64(1.0), 2.0]}
+        result: str = mcast_json_dumps(value, default=_default, indent=4)
+        self.assertEqual(result, json.dumps({"values": [1.0, 2.0]}, indent=4))
+
+    def test_get_poses_response_series(self):
+        object_to_reference_matrix: numpy.ndarray = numpy.identity(4, dtype="float64")
+        object_to_reference_matrix[0:3, 3] = [10.0, 20.5, -30.25]
+        pose: Pose = Pose(
+            target_id="target",
+            object_to_reference_matrix=Matrix4x4.from_numpy_array(object_to_reference_matrix),
+            solver_timestamp_utc_iso8601=datetime.datetime.utcnow().isoformat())
+        response_series: MCastResponseSeries = MCastResponseSeries(
+            series=[GetPosesResponse(detector_poses=list(), target_poses=[pose])])
+        result: dict = json.loads(response_series.json())
+        self.assertEqual(
+            result["series"][0]["target_poses"][0]["object_to_reference_matrix"]["values"],
+            object_to_reference_matrix.flatten().tolist())